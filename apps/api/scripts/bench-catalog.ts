@@ -0,0 +1,97 @@
+import { spawnSync } from 'node:child_process';
+import fs from 'node:fs';
+import path from 'node:path';
+import { performance } from 'node:perf_hooks';
+import { openBinaryCatalogs } from '../src/lib/binaryCatalog.js';
+
+// Cold-start + RSS benchmark: JSON.parse/flatten of apps/web/messages vs the
+// binary catalogs from `catalog_tools compile`. Each sample runs in a fresh
+// process so module caches and heap growth are not shared between runs.
+//
+//   python -m catalog_tools compile
+//   pnpm --filter @thesara/api exec tsx scripts/bench-catalog.ts [runs]
+
+const LOCALES = ['en', 'hr', 'de'] as const;
+const repoRoot = path.resolve(process.cwd(), '..', '..');
+const messagesDir = path.join(repoRoot, 'apps', 'web', 'messages');
+const compiledDir = path.join(messagesDir, 'compiled');
+const PROBES = ['Nav.about', 'Home.headline.one', 'Ambassador.page.calculator.title', 'Missing.key'];
+
+function flatten(obj: any, prefix = ''): Record<string, string> {
+  const out: Record<string, string> = {};
+  for (const [k, v] of Object.entries(obj || {})) {
+    const key = prefix ? `${prefix}.${k}` : k;
+    if (v && typeof v === 'object') {
+      Object.assign(out, flatten(v as any, key));
+    } else {
+      out[key] = String(v);
+    }
+  }
+  return out;
+}
+
+function readJson(file: string) {
+  return JSON.parse(fs.readFileSync(file, 'utf8').replace(/^\uFEFF/, ''));
+}
+
+function child(mode: string) {
+  const start = performance.now();
+  let lookup: (locale: (typeof LOCALES)[number], key: string) => string | undefined;
+  if (mode === 'json') {
+    const messages = Object.fromEntries(
+      LOCALES.map((l) => [
+        l,
+        flatten({ ...readJson(path.join(messagesDir, `${l}.json`)), Ambassador: readJson(path.join(messagesDir, `ambassador.${l}.json`)) }),
+      ]),
+    ) as Record<string, Record<string, string>>;
+    lookup = (l, k) => messages[l][k];
+  } else {
+    const catalogs = openBinaryCatalogs(compiledDir, LOCALES);
+    lookup = (l, k) => catalogs[l].get(k);
+  }
+  const loadMs = performance.now() - start;
+  for (const l of LOCALES) for (const k of PROBES) lookup(l, k);
+  process.stdout.write(JSON.stringify({
+    loadMs,
+    sinceProcessStartMs: performance.now(),
+    rss: process.memoryUsage().rss,
+    heapUsed: process.memoryUsage().heapUsed,
+  }));
+}
+
+function median(values: number[]) {
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.floor(sorted.length / 2)];
+}
+
+function main() {
+  const runs = Number(process.argv[2] ?? 15);
+  if (!fs.existsSync(path.join(compiledDir, 'strings.bin'))) {
+    console.error(`Missing ${compiledDir}; run \`python -m catalog_tools compile\` first.`);
+    process.exit(2);
+  }
+  for (const mode of ['json', 'binary']) {
+    const samples = [];
+    for (let i = 0; i < runs; i++) {
+      const res = spawnSync(process.execPath, [...process.execArgv, __filename, '--child', mode], { encoding: 'utf8' });
+      if (res.status !== 0) {
+        console.error(res.stderr);
+        process.exit(1);
+      }
+      samples.push(JSON.parse(res.stdout));
+    }
+    const mb = (n: number) => (n / 1024 / 1024).toFixed(1);
+    console.log(
+      `${mode.padEnd(6)} load ${median(samples.map((s) => s.loadMs)).toFixed(2)} ms` +
+        `  ready ${median(samples.map((s) => s.sinceProcessStartMs)).toFixed(1)} ms` +
+        `  rss ${mb(median(samples.map((s) => s.rss)))} MB` +
+        `  heap ${mb(median(samples.map((s) => s.heapUsed)))} MB`,
+    );
+  }
+}
+
+if (process.argv[2] === '--child') {
+  child(process.argv[3]);
+} else {
+  main();
+}
@@ -0,0 +1,105 @@
+import fs from 'node:fs';
+import path from 'node:path';
+
+// Reader for the binary catalogs emitted by `python -m catalog_tools compile`
+// (strings.bin + <locale>.idx). Node has no mmap, so each file is read once
+// into a Buffer; lookups are a binary search over the sorted key-hash index
+// and never parse JSON.
+//
+// Unlike an mmap'ed file, that Buffer is private to the process: every API
+// worker holds its own copy, and the OS page cache only speeds up the read.
+//
+// The compiled files are not built by `pnpm build` or deploy: they live in
+// apps/web/messages/compiled/, which is gitignored, and producing them (and
+// re-running compile whenever the JSON catalogs change) is left to the
+// operator. Nothing in the API loads them yet; scripts/bench-catalog.ts and
+// test/binaryCatalog.test.ts are the only users.
+
+const HEADER_SIZE = 12;
+const ENTRY_SIZE = 12;
+
+export function fnv1a32(bytes: Uint8Array): number {
+  let h = 0x811c9dc5;
+  for (let i = 0; i < bytes.length; i++) {
+    h = Math.imul(h ^ bytes[i], 0x01000193) >>> 0;
+  }
+  return h >>> 0;
+}
+
+export class StringTable {
+  readonly count: number;
+  readonly crc: number;
+  private readonly blob: number;
+
+  constructor(private readonly buf: Buffer) {
+    if (buf.toString('latin1', 0, 4) !== 'TCS1') {
+      throw new Error('binaryCatalog: not a string table');
+    }
+    this.count = buf.readUInt32LE(4);
+    this.crc = buf.readUInt32LE(8);
+    this.blob = HEADER_SIZE + 4 * (this.count + 1);
+  }
+
+  raw(id: number): Buffer {
+    const at = HEADER_SIZE + 4 * id;
+    return this.buf.subarray(this.blob + this.buf.readUInt32LE(at), this.blob + this.buf.readUInt32LE(at + 4));
+  }
+
+  get(id: number): string {
+    return this.raw(id).toString('utf8');
+  }
+}
+
+export class BinaryCatalog {
+  readonly size: number;
+
+  constructor(private readonly buf: Buffer, private readonly strings: StringTable) {
+    if (buf.toString('latin1', 0, 4) !== 'TCI1') {
+      throw new Error('binaryCatalog: not a catalog index');
+    }
+    if (buf.readUInt32LE(8) !== strings.crc) {
+      throw new Error('binaryCatalog: index was compiled against a different strings.bin');
+    }
+    this.size = buf.readUInt32LE(4);
+  }
+
+  private find(key: string): number | undefined {
+    const raw = Buffer.from(key, 'utf8');
+    const h = fnv1a32(raw);
+    let lo = 0;
+    let hi = this.size;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      const at = HEADER_SIZE + ENTRY_SIZE * mid;
+      const mh = this.buf.readUInt32LE(at);
+      if (mh < h || (mh === h && Buffer.compare(this.strings.raw(this.buf.readUInt32LE(at + 4)), raw) < 0)) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
+    }
+    if (lo >= this.size) return undefined;
+    const at = HEADER_SIZE + ENTRY_SIZE * lo;
+    if (this.buf.readUInt32LE(at) !== h) return undefined;
+    if (!this.strings.raw(this.buf.readUInt32LE(at + 4)).equals(raw)) return undefined;
+    return this.buf.readUInt32LE(at + 8);
+  }
+
+  get(key: string): string | undefined {
+    const id = this.find(key);
+    return id === undefined ? undefined : this.strings.get(id);
+  }
+
+  has(key: string): boolean {
+    return this.find(key) !== undefined;
+  }
+}
+
+export function openBinaryCatalogs<L extends string>(dir: string, locales: readonly L[]): Record<L, BinaryCatalog> {
+  const strings = new StringTable(fs.readFileSync(path.join(dir, 'strings.bin')));
+  const out = {} as Record<L, BinaryCatalog>;
+  for (const locale of locales) {
+    out[locale] = new BinaryCatalog(fs.readFileSync(path.join(dir, `${locale}.idx`)), strings);
+  }
+  return out;
+}
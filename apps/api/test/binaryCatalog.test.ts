@@ -0,0 +1,56 @@
+import assert from 'node:assert/strict';
+import fs from 'node:fs';
+import path from 'node:path';
+import { fileURLToPath } from 'node:url';
+import { BinaryCatalog, StringTable, fnv1a32, openBinaryCatalogs } from '../src/lib/binaryCatalog.ts';
+
+// The fixture is compiled by catalog_tools (Python); regenerate it with
+// `python -m catalog_tools.tests.test_binary` after changing the format.
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const FIXTURE = path.join(__dirname, 'fixtures', 'binary-catalog');
+const LOCALES = ['en', 'hr'] as const;
+
+// Same as flatten() in apps/web/i18n/config.ts.
+function flatten(obj: Record<string, unknown>, prefix = ''): Record<string, string> {
+  const out: Record<string, string> = {};
+  for (const [k, v] of Object.entries(obj || {})) {
+    const key = prefix ? `${prefix}.${k}` : k;
+    if (v && typeof v === 'object') {
+      Object.assign(out, flatten(v as Record<string, unknown>, key));
+    } else {
+      out[key] = String(v);
+    }
+  }
+  return out;
+}
+
+(async () => {
+  const utf8 = (s: string) => Buffer.from(s, 'utf8');
+  assert.equal(fnv1a32(utf8('')), 0x811c9dc5);
+  assert.equal(fnv1a32(utf8('a')), 0xe40c292c);
+  assert.equal(fnv1a32(utf8('foobar')), 0xbf9cf968);
+  assert.equal(fnv1a32(utf8('Collide.k139599')), fnv1a32(utf8('Collide.k322382')));
+
+  const catalogs = openBinaryCatalogs(FIXTURE, LOCALES);
+  for (const locale of LOCALES) {
+    const messages = flatten(JSON.parse(fs.readFileSync(path.join(FIXTURE, `${locale}.json`), 'utf8')));
+    const catalog = catalogs[locale];
+    assert.equal(catalog.size, Object.keys(messages).length, `${locale}: key count`);
+    for (const [key, value] of Object.entries(messages)) {
+      assert.equal(catalog.get(key), value, `${locale}: ${key}`);
+    }
+    assert.equal(catalog.get('Nav.nope'), undefined);
+    assert.equal(catalog.has('Nav'), false);
+  }
+  // Both keys of an FNV-1a collision are found by comparing key bytes.
+  assert.equal(catalogs.en.get('Collide.k139599'), 'first of a hash pair');
+  assert.equal(catalogs.en.get('Collide.k322382'), 'second of a hash pair');
+  assert.equal(catalogs.hr.has('Collide.k139599'), false);
+
+  // An index checks that it was compiled against this strings.bin.
+  const strings = new StringTable(fs.readFileSync(path.join(FIXTURE, 'strings.bin')));
+  const idx = Buffer.from(fs.readFileSync(path.join(FIXTURE, 'en.idx')));
+  idx.writeUInt32LE((idx.readUInt32LE(8) + 1) >>> 0, 8);
+  assert.throws(() => new BinaryCatalog(idx, strings), /different strings\.bin/);
+  console.log('binaryCatalog tests passed');
+})();
@@ -0,0 +1,7 @@
+"""Tooling for the translation catalogs in apps/web/messages.
+
+Run `python -m catalog_tools --help`. Subcommands are imported lazily, and
+commands chained with `+` share one set of parsed catalogs:
+
+    python -m catalog_tools repair de + validate + compile
+"""
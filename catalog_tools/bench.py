@@ -0,0 +1,81 @@
+"""Cold-start and RSS benchmark: json.load vs the mmapped binary catalogs.
+
+Every sample runs in a fresh interpreter so nothing is cached between runs.
+The Node side (JSON.parse vs binaryCatalog.ts) is apps/api/scripts/bench-catalog.ts.
+
+Usage: python -m catalog_tools compile && python -m catalog_tools.bench [runs]
+"""
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROBES = ["Nav.about", "Home.headline.one", "Ambassador.page.calculator.title", "Missing.key"]
+
+
+def child(mode, messages, compiled):
+    # Imports stay outside the timed region; only loading is measured. The
+    # JSON side is what a plain server would do: json.load + flatten, none of
+    # CatalogStore's encoding detection or duplicate-key bookkeeping.
+    from catalog_tools.paths import LOCALES
+
+    if mode == "json":
+        from catalog_tools.catalogs import flatten
+
+        def load(name):
+            with open(os.path.join(messages, f"{name}.json"), encoding="utf-8-sig") as f:
+                return json.load(f)
+
+        start = time.perf_counter()
+        catalogs = {}
+        for locale in LOCALES:
+            data = load(locale)
+            if os.path.exists(os.path.join(messages, f"ambassador.{locale}.json")):
+                data["Ambassador"] = load(f"ambassador.{locale}")
+            catalogs[locale] = flatten(data)
+    else:
+        from catalog_tools.binary import open_catalogs
+
+        start = time.perf_counter()
+        catalogs = open_catalogs(compiled)
+    load_ms = (time.perf_counter() - start) * 1000
+    for locale in LOCALES:
+        for key in PROBES:
+            catalogs[locale].get(key)
+    # ru_maxrss is KiB on Linux
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    print(json.dumps({"load_ms": load_ms, "rss": rss}))
+
+
+def main(argv):
+    from catalog_tools.paths import compiled_dir, messages_dir
+
+    runs = int(argv[0]) if argv else 15
+    if not os.path.exists(os.path.join(compiled_dir(), "strings.bin")):
+        sys.exit(f"Missing {compiled_dir()}; run `python -m catalog_tools compile` first.")
+    for mode in ("json", "binary"):
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            out = subprocess.run(
+                [sys.executable, "-m", "catalog_tools.bench", "--child", mode, messages_dir(), compiled_dir()],
+                cwd=PACKAGE_PARENT, capture_output=True, text=True, check=True,
+            )
+            wall_ms = (time.perf_counter() - start) * 1000
+            samples.append({**json.loads(out.stdout), "wall_ms": wall_ms})
+        med = lambda k: statistics.median(s[k] for s in samples)
+        print(
+            f"{mode:<6} load {med('load_ms'):.2f} ms  process {med('wall_ms'):.1f} ms"
+            f"  max rss {med('rss') / 1024 / 1024:.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 4 and sys.argv[1] == "--child":
+        child(*sys.argv[2:5])
+    else:
+        main(sys.argv[1:])
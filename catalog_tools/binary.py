@@ -0,0 +1,174 @@
+"""Compact binary catalogs for server-side lookups (`compile` subcommand).
+
+Output (apps/web/messages/compiled/):
+  strings.bin   deduplicated UTF-8 string table shared by all locales
+  <locale>.idx  key index sorted by (FNV-1a hash, key) pointing into strings.bin
+
+Both files are little-endian and meant to be mmapped by readers, so lookups
+are a binary search over the index with no JSON parsing at startup.
+apps/api/src/lib/binaryCatalog.ts reads the same format (into a per-process
+Buffer, as Node cannot mmap). The output is gitignored and no build or deploy
+step runs compile; whoever deploys the API has to.
+
+  strings.bin:  b"TCS1" | u32 count | u32 crc32 | u32 offsets[count + 1] | blob
+  <locale>.idx: b"TCI1" | u32 count | u32 strings crc32 | entries[count]
+                entry = u32 key hash, u32 key string id, u32 value string id
+"""
+import mmap
+import os
+import struct
+import zlib
+
+from catalog_tools.paths import LOCALES, compiled_dir
+
+STRINGS_MAGIC = b"TCS1"
+INDEX_MAGIC = b"TCI1"
+ENTRY = struct.Struct("<III")
+HEADER = struct.Struct("<4sII")
+
+
+def fnv1a32(data):
+    h = 0x811C9DC5
+    for b in data:
+        h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def build(flat_by_locale):
+    """Return (strings_bytes, {locale: index_bytes}) for flattened catalogs."""
+    ids = {}
+    table = []
+
+    def intern(s):
+        sid = ids.get(s)
+        if sid is None:
+            sid = ids[s] = len(table)
+            table.append(s.encode("utf-8"))
+        return sid
+
+    # Strings are numbered in index order, so the output only depends on the
+    # messages and not on the order the mappings iterate in.
+    entries_by_locale = {}
+    for locale, flat in flat_by_locale.items():
+        pairs = sorted((fnv1a32(key.encode("utf-8")), key.encode("utf-8"), key, value) for key, value in flat.items())
+        entries_by_locale[locale] = [(h, raw, intern(key), intern(value)) for h, raw, key, value in pairs]
+
+    offsets = [0]
+    for s in table:
+        offsets.append(offsets[-1] + len(s))
+    body = struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(table)
+    crc = zlib.crc32(body)
+    strings = HEADER.pack(STRINGS_MAGIC, len(table), crc) + body
+
+    indexes = {}
+    for locale, entries in entries_by_locale.items():
+        body = b"".join(ENTRY.pack(h, k, v) for h, _, k, v in entries)
+        indexes[locale] = HEADER.pack(INDEX_MAGIC, len(entries), crc) + body
+    return strings, indexes
+
+
+def compile_catalogs(store, out_dir=None, locales=LOCALES):
+    """Build the binary catalogs and stage them on `store`; store.save() writes them."""
+    out_dir = out_dir or compiled_dir(store.root)
+    strings, indexes = build({locale: store.shipped(locale) for locale in locales})
+    store.stage(os.path.join(out_dir, "strings.bin"), strings)
+    for locale, data in indexes.items():
+        store.stage(os.path.join(out_dir, f"{locale}.idx"), data)
+    return strings, indexes
+
+
+def _map(path):
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class StringTable:
+    """mmap-backed view of strings.bin."""
+
+    def __init__(self, path):
+        self.buf = _map(path)
+        magic, self.count, self.crc = HEADER.unpack_from(self.buf, 0)
+        if magic != STRINGS_MAGIC:
+            raise ValueError(f"{path}: not a string table")
+        self._offsets = HEADER.size
+        self._blob = HEADER.size + 4 * (self.count + 1)
+
+    def raw(self, sid):
+        start, end = struct.unpack_from("<II", self.buf, self._offsets + 4 * sid)
+        return self.buf[self._blob + start:self._blob + end]
+
+    def __getitem__(self, sid):
+        return self.raw(sid).decode("utf-8")
+
+
+class Catalog:
+    """O(log n) key lookups over an mmapped <locale>.idx."""
+
+    def __init__(self, path, strings):
+        self.strings = strings
+        self.buf = _map(path)
+        magic, self.count, crc = HEADER.unpack_from(self.buf, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"{path}: not a catalog index")
+        if crc != strings.crc:
+            raise ValueError(f"{path}: compiled against a different strings.bin")
+
+    def _entry(self, i):
+        return ENTRY.unpack_from(self.buf, HEADER.size + ENTRY.size * i)
+
+    def _find(self, key):
+        raw = key.encode("utf-8")
+        h = fnv1a32(raw)
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mh, mk, _ = self._entry(mid)
+            if mh < h or (mh == h and self.strings.raw(mk) < raw):
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count:
+            mh, mk, mv = self._entry(lo)
+            if mh == h and self.strings.raw(mk) == raw:
+                return mv
+        return None
+
+    def get(self, key, default=None):
+        sid = self._find(key)
+        return default if sid is None else self.strings[sid]
+
+    def __getitem__(self, key):
+        sid = self._find(key)
+        if sid is None:
+            raise KeyError(key)
+        return self.strings[sid]
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __len__(self):
+        return self.count
+
+    def items(self):
+        for i in range(self.count):
+            _, k, v = self._entry(i)
+            yield self.strings[k], self.strings[v]
+
+
+def open_catalogs(out_dir=None, locales=LOCALES):
+    out_dir = out_dir or compiled_dir()
+    strings = StringTable(os.path.join(out_dir, "strings.bin"))
+    return {locale: Catalog(os.path.join(out_dir, f"{locale}.idx"), strings) for locale in locales}
+
+
+def configure(parser):
+    parser.add_argument("--out", help="output directory (default: apps/web/messages/compiled)")
+
+
+def run(args, store):
+    strings, indexes = compile_catalogs(store, args.out)
+    count = struct.unpack_from("<I", strings, 4)[0]
+    print(f"strings.bin: {count} unique strings, {len(strings)} bytes")
+    for locale, data in indexes.items():
+        print(f"{locale}.idx: {(len(data) - HEADER.size) // ENTRY.size} keys, {len(data)} bytes")
+    return 0
@@ -0,0 +1,245 @@
+"""Bundle-size budget for the catalogs shipped to the browser (`budget` subcommand).
+
+Attributes raw / gzip / brotli bytes to every locale and namespace that the
+web app imports, lists the heaviest keys, and checks them against
+catalog-budget.json. apps/web/i18n/config.ts puts every namespace of every
+locale plus the ambassador catalogs in the shared bundle; app/faq imports the
+manual FAQ files into its own page chunk, so those are reported (and
+budgeted) as a separate page, with their own heaviest keys, and not counted
+in the locale total. Sizes are measured on minified JSON, which is what the
+bundler inlines for a JSON import.
+
+Usage:
+  python -m catalog_tools budget [--top N] [--json]
+  python -m catalog_tools budget --check      # exit 1 when over budget
+  python -m catalog_tools budget --record     # append to catalog-budget-history.jsonl
+
+brotli sizes come from the optional `brotli` package, or from Node's
+zlib.brotliCompressSync when it is not installed. With neither, they are
+null, a warning is printed and --check fails.
+"""
+import gzip
+import json
+import os
+import subprocess
+import sys
+import time
+
+from catalog_tools.catalogs import flatten
+from catalog_tools.paths import LOCALES
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BUDGET_FILE = "catalog-budget.json"
+HISTORY_FILE = "catalog-budget-history.jsonl"
+METRICS = ("raw", "gzip", "brotli")
+
+
+# Reads a JSON list of strings on stdin, prints their brotli sizes.
+NODE_BROTLI = """
+const zlib = require('zlib');
+const blobs = JSON.parse(require('fs').readFileSync(0, 'utf8')).map((s) => Buffer.from(s, 'utf8'));
+const { BROTLI_PARAM_QUALITY, BROTLI_PARAM_SIZE_HINT } = zlib.constants;
+console.log(JSON.stringify(blobs.map((b) =>
+  zlib.brotliCompressSync(b, { params: { [BROTLI_PARAM_QUALITY]: 11, [BROTLI_PARAM_SIZE_HINT]: b.length } }).length)));
+"""
+
+
+def minified(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def brotli_sizes(blobs):
+    """Return (sizes, source) for quality-11 brotli; sizes is None if no encoder is available."""
+    if brotli is not None:
+        return [len(brotli.compress(b, quality=11)) for b in blobs], "brotli"
+    try:
+        out = subprocess.run(
+            ["node", "-e", NODE_BROTLI], input=json.dumps([b.decode("utf-8") for b in blobs]),
+            capture_output=True, text=True, encoding="utf-8", check=True,
+        )
+        return json.loads(out.stdout), "node"
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None, None
+
+
+def shipped_namespaces(store, locale):
+    """{namespace: data} exactly as the shared web bundle imports it for one locale."""
+    namespaces = dict(store.tree(locale))
+    if store.exists(f"ambassador.{locale}"):
+        namespaces["Ambassador"] = store.tree(f"ambassador.{locale}")
+    return namespaces
+
+
+def shipped_pages(store, locale):
+    """{page: data} for catalogs imported by a single page's chunk."""
+    pages = {}
+    if store.exists(f"faq.{locale}.manual"):
+        pages["app/faq"] = store.tree(f"faq.{locale}.manual")
+    return pages
+
+
+def heaviest(data, top):
+    """The `top` keys of `data` by raw key + value bytes, heaviest first."""
+    keys = [(len(key.encode("utf-8")) + len(value.encode("utf-8")), key) for key, value in flatten(data).items()]
+    keys.sort(reverse=True)
+    return [{"key": key, "raw": n} for n, key in keys[:top]]
+
+
+def analyze(store, locales=LOCALES, top=10):
+    report = {"brotli": None, "locales": {}}
+    measured = []  # (minified JSON, sizes dict) whose brotli size is filled in below
+
+    def sizes(data):
+        raw = minified(data)
+        entry = {"raw": len(raw), "gzip": len(gzip.compress(raw, compresslevel=9, mtime=0)), "brotli": None}
+        measured.append((raw, entry))
+        return entry
+
+    for locale in locales:
+        namespaces = shipped_namespaces(store, locale)
+        pages = shipped_pages(store, locale)
+        ns_sizes = {ns: sizes(data) for ns, data in namespaces.items()}
+        report["locales"][locale] = {
+            "total": sizes(namespaces),
+            "namespaces": dict(sorted(ns_sizes.items(), key=lambda kv: -kv[1]["raw"])),
+            "pages": {page: sizes(data) for page, data in pages.items()},
+            "top_keys": heaviest(namespaces, top),
+            "page_top_keys": {page: heaviest(data, top) for page, data in pages.items()},
+        }
+
+    brotli_bytes, report["brotli"] = brotli_sizes([raw for raw, _ in measured])
+    for (_, entry), size in zip(measured, brotli_bytes or ()):
+        entry["brotli"] = size
+    return report
+
+
+def load_budget(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check(report, budget):
+    """Return a list of human-readable budget violations."""
+    metric = budget.get("metric", "gzip")
+    limits = budget.get("namespaces", {})
+    default = budget.get("default")
+    violations = []
+    for locale, data in report["locales"].items():
+        for ns, ns_sizes in data["namespaces"].items():
+            limit = limits.get(ns, default)
+            size = ns_sizes.get(metric)
+            if limit is None or size is None:
+                continue
+            if size > limit:
+                violations.append(f"{locale}/{ns}: {size} B {metric} > budget {limit} B")
+        for page, page_sizes in data.get("pages", {}).items():
+            limit = budget.get("pages", {}).get(page)
+            size = page_sizes.get(metric)
+            if limit is not None and size is not None and size > limit:
+                violations.append(f"{locale}/{page} page: {size} B {metric} > budget {limit} B")
+        total_limit = budget.get("locale_total")
+        total = data["total"].get(metric)
+        if total_limit is not None and total is not None and total > total_limit:
+            violations.append(f"{locale}: {total} B {metric} total > budget {total_limit} B")
+    return violations
+
+
+def last_recorded(path):
+    if not os.path.exists(path):
+        return None
+    last = None
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                last = line
+    return json.loads(last) if last else None
+
+
+def record(report, path):
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(path), capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    entry = {
+        "time": int(time.time()),
+        "commit": commit,
+        "brotli": report["brotli"],
+        "locales": {
+            locale: {"total": data["total"], "namespaces": data["namespaces"], "pages": data["pages"]}
+            for locale, data in report["locales"].items()
+        },
+    }
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def _fmt(n):
+    return "-" if n is None else f"{n / 1024:.1f}K"
+
+
+def _delta(now, before):
+    if before is None or now is None:
+        return ""
+    diff = now - before
+    return f" ({'+' if diff >= 0 else ''}{diff})" if diff else ""
+
+
+def print_report(report, previous=None, metric="gzip"):
+    for locale, data in report["locales"].items():
+        prev = (previous or {}).get("locales", {}).get(locale, {})
+        total = data["total"]
+        print(f"\n== {locale}: raw {_fmt(total['raw'])}  gzip {_fmt(total['gzip'])}  brotli {_fmt(total['brotli'])}"
+              f"{_delta(total[metric], prev.get('total', {}).get(metric))}")
+        print(f"  {'namespace':<28}{'raw':>9}{'gzip':>9}{'brotli':>9}")
+        for ns, s in data["namespaces"].items():
+            before = prev.get("namespaces", {}).get(ns, {}).get(metric)
+            print(f"  {ns:<28}{_fmt(s['raw']):>9}{_fmt(s['gzip']):>9}{_fmt(s['brotli']):>9}{_delta(s[metric], before)}")
+        for page, s in data["pages"].items():
+            before = prev.get("pages", {}).get(page, {}).get(metric)
+            label = f"page {page} (own chunk)"
+            print(f"  {label:<28}{_fmt(s['raw']):>9}{_fmt(s['gzip']):>9}{_fmt(s['brotli']):>9}{_delta(s[metric], before)}")
+        print("  heaviest keys in the shared bundle (raw bytes):")
+        for item in data["top_keys"]:
+            print(f"    {item['raw']:>6}  {item['key']}")
+        for page, items in data["page_top_keys"].items():
+            print(f"  heaviest keys in page {page} (raw bytes):")
+            for item in items:
+                print(f"    {item['raw']:>6}  {item['key']}")
+
+
+def configure(parser):
+    parser.add_argument("--top", type=int, default=10, help="heaviest keys to list per locale and page")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--check", action="store_true", help="exit 1 if a namespace is over budget")
+    parser.add_argument("--record", action="store_true", help="append this run to the history file")
+
+
+def run(args, store):
+    history_path = os.path.join(store.root, HISTORY_FILE)
+    report = analyze(store, top=args.top)
+    budget = load_budget(os.path.join(store.root, BUDGET_FILE))
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print_report(report, last_recorded(history_path), budget.get("metric", "gzip"))
+    if report["brotli"] is None:
+        print("warning: no brotli encoder (pip install brotli, or put node on PATH); brotli sizes are null",
+              file=sys.stderr)
+    if args.record:
+        record(report, history_path)
+    if args.check:
+        violations = check(report, budget)
+        if report["brotli"] is None:
+            violations.append("brotli sizes could not be measured")
+        for v in violations:
+            print(f"OVER BUDGET {v}", file=sys.stderr)
+        if violations:
+            return 1
+        print("All catalog namespaces within budget.", file=sys.stderr)
+    return 0
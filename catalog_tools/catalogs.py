@@ -0,0 +1,229 @@
+"""Loading, flattening and saving catalogs, shared by every subcommand."""
+import json
+import os
+
+from catalog_tools.paths import find_repo_root, messages_dir
+
+
+class CatalogError(ValueError):
+    pass
+
+
+def to_js_string(value):
+    # Mirror String(v) in apps/web/i18n/config.ts
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return str(value)
+
+
+def flatten(obj, prefix=""):
+    # Same shape as flatten() in apps/web/i18n/config.ts: arrays are objects
+    # there too, so their items end up under numeric keys.
+    out = {}
+    items = obj.items() if isinstance(obj, dict) else enumerate(obj or [])
+    for k, v in items:
+        key = f"{prefix}.{k}" if prefix else str(k)
+        if isinstance(v, (dict, list)) and v:
+            out.update(flatten(v, key))
+        elif isinstance(v, (dict, list)):
+            continue
+        else:
+            out[key] = to_js_string(v)
+    return out
+
+
+def set_path(data, key, value, like=None):
+    """Set a flattened `key` inside nested `data`, creating containers as needed.
+
+    "steps.1" alone cannot tell a list from {"1": ...}, so a missing
+    container copies the type of the one at the same path in `like` (the
+    tree the key was flattened from) and is an object otherwise. Numeric
+    parts index into existing lists, growing them as needed.
+    """
+    parts = key.split(".")
+    cur = data
+    for i, part in enumerate(parts):
+        if isinstance(like, dict):
+            like = like.get(part)
+        elif isinstance(like, list) and part.isdigit() and int(part) < len(like):
+            like = like[int(part)]
+        else:
+            like = None
+        last = i == len(parts) - 1
+        child = value if last else ([] if isinstance(like, list) else {})
+        if isinstance(cur, list):
+            if not part.isdigit():
+                raise CatalogError(f"{key}: {part!r} indexes a list")
+            index = int(part)
+            if index >= len(cur):
+                cur.extend([None] * (index + 1 - len(cur)))
+            if last or not isinstance(cur[index], (dict, list)):
+                cur[index] = child
+            cur = cur[index]
+        else:
+            if last or not isinstance(cur.get(part), (dict, list)):
+                cur[part] = child
+            cur = cur[part]
+
+
+def deep_merge(target, source):
+    """Recursively copy `source` into `target`; leaves in `source` win."""
+    for k, v in source.items():
+        if isinstance(v, dict) and isinstance(target.get(k), dict):
+            deep_merge(target[k], v)
+        else:
+            target[k] = v
+    return target
+
+
+def decode_bytes(data):
+    """Return (text, encoding). Catalogs have been saved as UTF-16 and cp1252 before."""
+    if data[:2] in (b"\xff\xfe", b"\xfe\xff"):
+        return data.decode("utf-16"), "utf-16"
+    try:
+        return data.decode("utf-8-sig"), "utf-8-sig" if data[:3] == b"\xef\xbb\xbf" else "utf-8"
+    except UnicodeDecodeError:
+        pass
+    try:
+        return data.decode("cp1252"), "cp1252"
+    except UnicodeDecodeError:
+        return data.decode("latin-1"), "latin-1"
+
+
+def dump_json(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def write_atomic(path, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _dict_noting(duplicates):
+    # Like JSON.parse, the last duplicate key wins; remember which ones there were.
+    def hook(pairs):
+        out = {}
+        for k, v in pairs:
+            if k in out:
+                duplicates.append(k)
+            out[k] = v
+        return out
+
+    return hook
+
+
+class CatalogStore:
+    """Parsed catalogs for one invocation.
+
+    Commands mutate the trees from tree() in place and call touch(), and
+    save() writes only what changed. Files derived from the
+    catalogs (compiled output) are queued with stage() and written by save()
+    too, so they never disagree with the JSON on disk. Catalogs are named by
+    file stem ("de", "ambassador.de", "faq.hr.manual").
+    """
+
+    def __init__(self, root=None):
+        self.root = root or find_repo_root()
+        self.dir = messages_dir(self.root)
+        self.encodings = {}
+        self.duplicates = {}
+        self.dirty = set()
+        self.pending = {}
+        self._trees = {}
+        self._model = None
+
+    def path(self, name):
+        return os.path.join(self.dir, f"{name}.json")
+
+    def exists(self, name):
+        return name in self._trees or os.path.isfile(self.path(name))
+
+    def names(self):
+        return sorted(f[: -len(".json")] for f in os.listdir(self.dir) if f.endswith(".json"))
+
+    def _parse(self, name):
+        path = self.path(name)
+        try:
+            with open(path, "rb") as f:
+                text, self.encodings[name] = decode_bytes(f.read())
+            # strict=False accepts raw newlines inside strings, which
+            # hand edits have left behind; they are escaped on save.
+            dupes = self.duplicates[name] = []
+            return json.loads(text, strict=False, object_pairs_hook=_dict_noting(dupes))
+        except FileNotFoundError:
+            raise CatalogError(f"{path}: no such catalog") from None
+        except ValueError as e:
+            raise CatalogError(f"{path}: {e}") from None
+
+    def tree(self, name):
+        """The parsed catalog, kept for the rest of the run so it can be edited and saved."""
+        if name not in self._trees:
+            self._trees[name] = self._parse(name)
+        return self._trees[name]
+
+    def flat(self, name):
+        """Flattened messages of one catalog, as a read-only view over model()."""
+        from catalog_tools.model import ColumnView
+
+        if not self.exists(name):
+            raise CatalogError(f"{self.path(name)}: no such catalog")
+        return ColumnView(self.model(name), name)
+
+    def shipped(self, locale):
+        """Flat messages for `locale` exactly as apps/web/i18n/config.ts builds them."""
+        from catalog_tools.model import ColumnView, OverlayView
+
+        base = self.flat(locale)
+        name = f"ambassador.{locale}"
+        if not self.exists(name):
+            return base
+        return OverlayView(base, ColumnView(self.model(name), name, "Ambassador."), "Ambassador.")
+
+    def model(self, *names):
+        """The store's CatalogModel, with columns for `names` loaded.
+
+        All catalogs share one key table. A catalog that does not exist gets
+        an empty column, so it compares as missing every key.
+        """
+        from catalog_tools.model import CatalogModel, iter_leaves
+
+        if self._model is None:
+            self._model = CatalogModel()
+        for name in names:
+            if name not in self._model.columns:
+                pairs = iter_leaves(self.tree(name)) if self.exists(name) else ()
+                self._model.add_column(name, pairs)
+        return self._model
+
+    def touch(self, name):
+        """Mark `name` as modified and drop its column from model()."""
+        self.dirty.add(name)
+        if self._model is not None:
+            self._model.drop_column(name)
+
+    def stage(self, path, data):
+        """Queue bytes derived from the catalogs to be written by save()."""
+        self.pending[path] = data
+
+    def save(self):
+        written = []
+        for name in sorted(self.dirty):
+            dump_json(self.path(name), self._trees[name])
+            self.encodings[name] = "utf-8"
+            written.append(self.path(name))
+        for path in sorted(self.pending):
+            write_atomic(path, self.pending[path])
+            written.append(path)
+        self.dirty.clear()
+        self.pending.clear()
+        return written
@@ -0,0 +1,117 @@
+"""Command-line entry point: `python -m catalog_tools CMD [ARGS] [+ CMD [ARGS] ...]`.
+
+Only the modules of the commands actually used are imported, and every
+command in a `+` chain shares one CatalogStore, so each catalog is parsed once
+and written once at the end (only if every command succeeded). Derived files
+such as the compiled catalogs follow the same rule.
+"""
+import importlib
+import sys
+
+# name -> (module, one-line help). Keep imports out of this file's top level.
+COMMANDS = {
+    "repair": ("catalog_tools.repair", "undo mojibake and re-save catalogs as UTF-8"),
+    "validate": ("catalog_tools.validate", "check parity with en, placeholders and encoding"),
+    "merge": ("catalog_tools.merge", "fill missing keys from en or apply a JSON patch"),
+    "compile": ("catalog_tools.binary", "emit mmap-able binary catalogs for the API"),
+    "stats": ("catalog_tools.stats", "key counts, coverage and corruption per catalog"),
+    "history": ("catalog_tools.history", "per-key history mined from git; restore last good values"),
+    "budget": ("catalog_tools.budget", "bundle-size attribution and budget check"),
+    "synth": ("catalog_tools.synthetic", "generate large synthetic catalogs for benchmarks"),
+}
+
+USAGE = """usage: python -m catalog_tools [--dry-run] [--root DIR] CMD [ARGS] [+ CMD [ARGS] ...]
+
+options:
+  --dry-run   run the commands but do not write any catalog or compiled file
+  --root DIR  repository root (default: found from the working directory)
+
+commands:
+{commands}
+
+Run `python -m catalog_tools CMD --help` for a command's options."""
+
+
+def usage():
+    width = max(map(len, COMMANDS))
+    return USAGE.format(commands="\n".join(f"  {name:<{width}}  {help}" for name, (_, help) in COMMANDS.items()))
+
+
+def split_chain(argv):
+    chain = [[]]
+    for arg in argv:
+        if arg == "+":
+            chain.append([])
+        else:
+            chain[-1].append(arg)
+    return [segment for segment in chain if segment]
+
+
+def parse_command(argv):
+    import argparse
+
+    name, rest = argv[0], argv[1:]
+    module_name, help = COMMANDS[name]
+    module = importlib.import_module(module_name)
+    parser = argparse.ArgumentParser(prog=f"python -m catalog_tools {name}", description=help)
+    module.configure(parser)
+    return name, module, parser.parse_args(rest)
+
+
+def pending(store):
+    import os
+
+    names = sorted(store.dirty) + [os.path.relpath(path, store.root) for path in sorted(store.pending)]
+    return ", ".join(names)
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    dry_run, root = False, None
+    while argv and argv[0].startswith("-"):
+        opt = argv.pop(0)
+        if opt == "--dry-run":
+            dry_run = True
+        elif opt == "--root" and argv:
+            root = argv.pop(0)
+        elif opt in ("-h", "--help"):
+            print(usage())
+            return 0
+        else:
+            print(f"unknown option {opt}\n\n{usage()}", file=sys.stderr)
+            return 2
+    chain = split_chain(argv)
+    if not chain:
+        print(usage(), file=sys.stderr)
+        return 2
+    unknown = [segment[0] for segment in chain if segment[0] not in COMMANDS]
+    if unknown:
+        print(f"unknown command {unknown[0]!r}\n\n{usage()}", file=sys.stderr)
+        return 2
+
+    # Parse the whole chain before running anything so a typo in the last
+    # command does not leave the first ones half-applied.
+    commands = [parse_command(segment) for segment in chain]
+
+    from catalog_tools.catalogs import CatalogError, CatalogStore
+
+    try:
+        store = CatalogStore(root)
+        for name, module, args in commands:
+            if len(commands) > 1:
+                print(f"== {name}")
+            code = module.run(args, store)
+            if code:
+                if store.dirty or store.pending:
+                    print(f"{name} failed; not writing {pending(store)}", file=sys.stderr)
+                return code
+    except (CatalogError, FileNotFoundError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    if (store.dirty or store.pending) and dry_run:
+        print(f"dry run: would write {pending(store)}", file=sys.stderr)
+    elif store.dirty or store.pending:
+        for path in store.save():
+            print(f"Wrote {path}", file=sys.stderr)
+    return 0
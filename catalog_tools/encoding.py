@@ -0,0 +1,118 @@
+"""Detecting and undoing mojibake in catalog strings.
+
+hr.json and de.json have repeatedly been round-tripped through the wrong
+codec (UTF-8 read as cp1252/latin-1, sometimes via a cp437 console, sometimes
+several times). Rather than a table of known-bad words, repair_text() finds
+runs of non-ASCII characters and re-encodes each run through whichever chain
+of codecs makes it look most like en/hr/de text.
+"""
+import re
+
+# Sequences that only show up when UTF-8 was decoded as latin-1/cp1252
+# (possibly several times, "â”"/"â•"/"â–" via a cp437 console). None of them
+# occur in legitimate en/hr/de text.
+MOJIBAKE = re.compile("Ã|Å|Â|â€|â‚|â†|â”|â•|â–|ðŸ|\ufffd")
+
+# Characters real catalog text is made of, beyond ASCII.
+EXPECTED = set(
+    "čćžšđČĆŽŠĐäöüßÄÖÜéèàáíóúñçÉ"
+    "–—„“”‘’‚…€«»·•°§©®™× "
+)
+
+# (encode, decode) steps that undo one wrong decode.
+TRANSFORMS = (
+    ("cp1252", "utf-8"),
+    ("latin-1", "utf-8"),
+    ("cp437", "utf-8"),
+    ("cp437", "cp1252"),
+)
+MAX_STEPS = 4
+
+_NON_ASCII_RUN = re.compile(r"[^\x00-\x7f]+")
+# C0/C1 controls and bidi embeddings: what undefined cp1252 bytes and
+# broken chains decode to.
+_CONTROL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f\u202a-\u202e\u2066-\u2069]")
+# Box drawing and block elements: what UTF-8 looks like through cp437.
+_BOX = re.compile("[\u2500-\u259f]")
+
+
+def mojibake_score(value):
+    return len(MOJIBAKE.findall(value)) if value else 0
+
+
+def _oddness(run):
+    return sum(1 for ch in run if ch not in EXPECTED) + 2 * mojibake_score(run) + len(_BOX.findall(run))
+
+
+def _encode(run, codec):
+    # cp1252 leaves 0x81/0x8d/0x8f/0x90/0x9d undefined; latin-1 decoding maps
+    # them to C1 controls, so accept those per character.
+    out = bytearray()
+    for ch in run:
+        try:
+            out += ch.encode(codec)
+        except UnicodeEncodeError:
+            if ord(ch) > 0xFF:
+                return None
+            out.append(ord(ch))
+    return bytes(out)
+
+
+def _candidates(run):
+    for enc, dec in TRANSFORMS:
+        raw = _encode(run, enc)
+        if raw is None:
+            continue
+        try:
+            yield raw.decode(dec)
+        except UnicodeDecodeError:
+            continue
+
+
+def _repair_run(match):
+    # Only runs that carry a mojibake marker are touched: correct text such as
+    # "Ça va" or "±10 %" also has codec round trips into EXPECTED characters.
+    # Every transform chain up to MAX_STEPS long is tried (intermediate steps
+    # may look worse, e.g. "▄" on the way from "â–„" to "Ü"); a candidate must
+    # have fewer markers and no control characters, and the least odd one
+    # wins, preferring shorter results and then shorter chains.
+    run = match.group(0)
+    markers = mojibake_score(run)
+    if not markers:
+        return run
+    best = (_oddness(run), len(run), 0, run)
+    seen = {run}
+    frontier = [run]
+    for depth in range(1, MAX_STEPS + 1):
+        nxt = []
+        for text in frontier:
+            for candidate in _candidates(text):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                nxt.append(candidate)
+                if mojibake_score(candidate) < markers and not _CONTROL.search(candidate):
+                    best = min(best, (_oddness(candidate), len(candidate), depth, candidate))
+        frontier = nxt
+    return best[3]
+
+
+def repair_text(text):
+    if not isinstance(text, str) or text.isascii():
+        return text
+    return _NON_ASCII_RUN.sub(_repair_run, text)
+
+
+def repair_tree(data):
+    """Repair every string in a parsed catalog in place; return the number changed."""
+    changed = 0
+    items = data.items() if isinstance(data, dict) else enumerate(data)
+    for k, v in list(items):
+        if isinstance(v, (dict, list)):
+            changed += repair_tree(v)
+        elif isinstance(v, str):
+            fixed = repair_text(v)
+            if fixed != v:
+                data[k] = fixed
+                changed += 1
+    return changed
@@ -0,0 +1,351 @@
+"""Per-key history of apps/web/messages/*.json mined from git (`history` subcommand).
+
+Every revision of every catalog is streamed through a single
+`git cat-file --batch` process, flattened, and folded into a per-key timeline
+of (commit, value hash, mojibake score). Commits on merged branches are
+walked too, parents first, and a value is credited to the commit that
+introduced it: a key broken on a branch names the branch commit, not the
+merge. The index lives in
+.git/catalog-history.json and is extended incrementally from the last indexed
+commit, so queries only pay for commits that arrived since the previous run.
+
+Catalogs are named by file stem: "de" is de.json, "ambassador.hr" is
+ambassador.hr.json.
+
+Usage:
+  python -m catalog_tools history update
+  python -m catalog_tools history show de Nav.about
+  python -m catalog_tools history last-good de Nav.about
+  python -m catalog_tools history broken de
+  python -m catalog_tools history restore de [KEY ...]
+"""
+import hashlib
+import json
+import os
+import subprocess
+import sys
+
+from catalog_tools.catalogs import decode_bytes, flatten, set_path, to_js_string
+from catalog_tools.encoding import mojibake_score
+from catalog_tools.paths import MESSAGES_SUBDIR, find_repo_root
+
+MESSAGES_PATH = MESSAGES_SUBDIR.replace(os.sep, "/")
+# Bump whenever the event format or mojibake_score() changes.
+INDEX_VERSION = 3
+
+
+def value_hash(value):
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()[:16]
+
+
+def git(*args, cwd=None):
+    return subprocess.run(
+        ["git", *args], cwd=cwd or find_repo_root(), capture_output=True, text=True, check=True
+    ).stdout
+
+
+def index_path(root=None):
+    root = root or find_repo_root()
+    git_dir = git("rev-parse", "--git-dir", cwd=root).strip()
+    return os.path.join(root, git_dir, "catalog-history.json")
+
+
+class BlobReader:
+    """One long-lived `git cat-file --batch` for every blob we need."""
+
+    def __init__(self, root=None):
+        self.proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"], cwd=root or find_repo_root(), stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+
+    def read(self, sha):
+        self.proc.stdin.write(sha.encode("ascii") + b"\n")
+        self.proc.stdin.flush()
+        header = self.proc.stdout.readline().split()
+        if len(header) < 3 or header[1] != b"blob":
+            return None
+        data = self.proc.stdout.read(int(header[2]))
+        self.proc.stdout.read(1)
+        return data
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+
+
+def decode_catalog(data):
+    text, _ = decode_bytes(data)
+    parsed = json.loads(text)
+    if isinstance(parsed, (dict, list)):
+        return flatten(parsed)
+    return {"": to_js_string(parsed)}
+
+
+def _blob(sha):
+    # git writes an all-zero id for the side of a diff where the file is absent.
+    return None if not sha.strip("0") else sha
+
+
+def iter_changes(root, since=None):
+    """Yield (sha, timestamp, subject, [(path, parent blobs, blob)]), parents before children.
+
+    Every commit reachable from HEAD is listed, merged branches included. A
+    merge lists a catalog only where it differs from every parent (git's
+    combined diff), with one blob per parent. A blob is None where the file
+    does not exist.
+    """
+    rev = f"{since}..HEAD" if since else "HEAD"
+    out = git(
+        "log", "--reverse", "--topo-order", "-c", "--no-renames", "--raw", "--no-abbrev",
+        "--format=%x00%H %ct %s", rev, "--", f"{MESSAGES_PATH}/*.json", cwd=root,
+    )
+    commit = None
+    for line in out.splitlines():
+        if line.startswith("\x00"):
+            if commit:
+                yield commit
+            sha, ts, subject = (line[1:].split(" ", 2) + [""])[:3]
+            commit = (sha, int(ts), subject, [])
+        elif line.startswith(":") and commit:
+            meta, path = line.split("\t", 1)
+            n_parents = len(line) - len(line.lstrip(":"))
+            shas = meta.split()[n_parents + 1: 2 * n_parents + 2]
+            if os.path.dirname(path) == MESSAGES_PATH:
+                commit[3].append((path, [_blob(sha) for sha in shas[:-1]], _blob(shas[-1])))
+    if commit:
+        yield commit
+
+
+def empty_index():
+    return {"version": INDEX_VERSION, "head": None, "commits": [], "values": {}, "unparsed": {}, "files": {}}
+
+
+def load_index(path=None):
+    path = path or index_path()
+    if not os.path.exists(path):
+        return empty_index()
+    with open(path, "r", encoding="utf-8") as f:
+        index = json.load(f)
+    return index if index.get("version") == INDEX_VERSION else empty_index()
+
+
+def save_index(index, path=None):
+    path = path or index_path()
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+class FlatCache:
+    """Flattened blobs, recently used first out of git.
+
+    An unparseable blob stands for the last parseable revision before it
+    (index["unparsed"] maps it there), so its children are compared with that.
+    """
+
+    SIZE = 32
+
+    def __init__(self, index, reader):
+        self.unparsed = index["unparsed"]
+        self.reader = reader
+        self.flats = {}
+
+    def resolve(self, blob):
+        while blob in self.unparsed:
+            blob = self.unparsed[blob]
+        return blob
+
+    def get(self, blob):
+        blob = self.resolve(blob)
+        if blob is None:
+            return {}
+        flat = self.flats.pop(blob, None)
+        if flat is None:
+            flat = decode_catalog(self.reader.read(blob))
+            if len(self.flats) >= self.SIZE:
+                del self.flats[next(iter(self.flats))]
+        self.flats[blob] = flat
+        return flat
+
+
+def apply_revision(index, entry, commit_idx, flat, parents):
+    """Append an event for every key whose value here is in none of the parents."""
+    values = index["values"]
+    for key, value in flat.items():
+        if all(p.get(key) != value for p in parents):
+            h = value_hash(value)
+            values.setdefault(h, value)
+            entry["keys"].setdefault(key, []).append([commit_idx, h, mojibake_score(value)])
+    for key in set(parents[0]).intersection(*parents[1:]) - flat.keys():
+        entry["keys"].setdefault(key, []).append([commit_idx, None, 0])
+
+
+def head_blobs(root):
+    out = git("ls-tree", "HEAD", f"{MESSAGES_PATH}/", cwd=root)
+    blobs = {}
+    for line in out.splitlines():
+        meta, path = line.split("\t", 1)
+        if path.endswith(".json"):
+            blobs[os.path.basename(path)[: -len(".json")]] = meta.split()[2]
+    return blobs
+
+
+def update(index, root=None):
+    root = root or find_repo_root()
+    head = git("rev-parse", "HEAD", cwd=root).strip()
+    if index["head"] == head:
+        return 0
+    if index["head"] and subprocess.run(
+        ["git", "merge-base", "--is-ancestor", index["head"], head], cwd=root
+    ).returncode != 0:
+        # History was rewritten under us; start over.
+        index.clear()
+        index.update(empty_index())
+
+    reader = BlobReader(root)
+    flats = FlatCache(index, reader)
+    added = 0
+    try:
+        for sha, ts, subject, changes in iter_changes(root, index["head"]):
+            commit_idx = len(index["commits"])
+            index["commits"].append([sha, ts, subject])
+            added += 1
+            for path, parents, blob in changes:
+                stem = os.path.basename(path)[: -len(".json")]
+                entry = index["files"].setdefault(stem, {"keys": {}, "errors": [], "blob": None, "current": {}})
+                try:
+                    flat = flats.get(blob)
+                except (ValueError, TypeError) as e:
+                    # Unparseable revision: keep previous values, remember why.
+                    entry["errors"].append([commit_idx, str(e)[:200]])
+                    index["unparsed"][blob] = flats.resolve(parents[0])
+                    continue
+                apply_revision(index, entry, commit_idx, flat, [flats.get(p) for p in parents])
+        # A key's current value is the one at HEAD, which on a merged history
+        # is not necessarily its last event.
+        blobs = head_blobs(root)
+        for stem, entry in index["files"].items():
+            blob = flats.resolve(blobs.get(stem))
+            if blob != entry["blob"]:
+                entry["blob"] = blob
+                entry["current"] = {key: value_hash(value) for key, value in flats.get(blob).items()}
+    finally:
+        reader.close()
+    index["head"] = head
+    return added
+
+
+def open_index(root=None):
+    path = index_path(root)
+    index = load_index(path)
+    if update(index, root):
+        save_index(index, path)
+    return index
+
+
+def timeline(index, catalog, key):
+    entry = index["files"].get(catalog)
+    if entry is None:
+        raise KeyError(f"unknown catalog {catalog!r}")
+    commits, values = index["commits"], index["values"]
+    return [
+        {
+            "commit": commits[ci][0],
+            "time": commits[ci][1],
+            "subject": commits[ci][2],
+            "value": values.get(h) if h else None,
+            "deleted": h is None,
+            "mojibake": score,
+        }
+        for ci, h, score in entry["keys"].get(key, [])
+    ]
+
+
+def last_good(index, catalog, key):
+    for event in reversed(timeline(index, catalog, key)):
+        if not event["deleted"] and event["mojibake"] == 0:
+            return event
+    return None
+
+
+def broken_keys(index, catalog):
+    """Keys whose current value scores as mojibake, with the commit that broke them."""
+    out = {}
+    entry = index["files"][catalog]
+    for key, current in entry["current"].items():
+        events = timeline(index, catalog, key)
+        hashes = [h for _, h, _ in entry["keys"].get(key, [])]
+        if current not in hashes:
+            continue
+        i = len(hashes) - 1 - hashes[::-1].index(current)
+        if not events[i]["mojibake"]:
+            continue
+        while i and not events[i - 1]["deleted"] and events[i - 1]["mojibake"]:
+            i -= 1
+        out[key] = events[i]
+    return out
+
+
+def restore(index, store, catalog, keys=None):
+    """Put the last good value of each key (default: every broken key) back into `catalog`."""
+    keys = keys or list(broken_keys(index, catalog))
+    current = store.flat(catalog)
+    fixes = {}
+    for key in keys:
+        good = last_good(index, catalog, key)
+        if good and current.get(key) != good["value"]:
+            fixes[key] = good
+    if fixes:
+        data = store.tree(catalog)
+        for key, good in fixes.items():
+            set_path(data, key, good["value"])
+        store.touch(catalog)
+    return fixes
+
+
+def _short(event):
+    return f"{event['commit'][:10]} {event['subject'][:50]}"
+
+
+def configure(parser):
+    sub = parser.add_subparsers(dest="action", required=True)
+    sub.add_parser("update", help="index commits that arrived since the last run")
+    for name, help in (("show", "timeline of one key"), ("last-good", "last clean value of one key")):
+        p = sub.add_parser(name, help=help)
+        p.add_argument("catalog")
+        p.add_argument("key")
+    sub.add_parser("broken", help="keys whose current value is mojibake").add_argument("catalog")
+    p = sub.add_parser("restore", help="restore last good values (default: every broken key)")
+    p.add_argument("catalog")
+    p.add_argument("keys", nargs="*")
+
+
+def run(args, store):
+    index = open_index(store.root)
+    if args.action != "update" and args.catalog not in index["files"]:
+        print(f"No history for catalog {args.catalog!r}; known: {', '.join(sorted(index['files']))}", file=sys.stderr)
+        return 1
+    if args.action == "update":
+        print(f"Indexed {len(index['commits'])} commits, {len(index['files'])} catalogs (head {index['head'][:10]}).")
+    elif args.action == "show":
+        for event in timeline(index, args.catalog, args.key):
+            value = "<deleted>" if event["deleted"] else json.dumps(event["value"], ensure_ascii=False)
+            flag = f" [mojibake {event['mojibake']}]" if event["mojibake"] else ""
+            print(f"{_short(event)}{flag}\n    {value}")
+    elif args.action == "last-good":
+        event = last_good(index, args.catalog, args.key)
+        if event is None:
+            print(f"No clean value of {args.key} in {args.catalog} history.", file=sys.stderr)
+            return 1
+        print(event["value"])
+        print(f"  from {_short(event)}", file=sys.stderr)
+    elif args.action == "broken":
+        for key, event in sorted(broken_keys(index, args.catalog).items()):
+            print(f"{key}: broken since {_short(event)}")
+    elif args.action == "restore":
+        fixes = restore(index, store, args.catalog, args.keys)
+        for key, event in sorted(fixes.items()):
+            print(f"Restoring {key} from {_short(event)}")
+        print(f"{len(fixes)} keys restored in {args.catalog}.json.")
+    return 0
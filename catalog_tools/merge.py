@@ -0,0 +1,60 @@
+"""Fill missing keys and apply translation patches (`merge` subcommand).
+
+Without --patch, copies every key that exists in the source locale but not in
+a target locale (the same job as tools/merge-i18n.mjs, for the ambassador
+catalogs too). --patch applies a JSON file of the form
+{"hr": {...}, "ambassador.de": {...}} by deep-merging each entry into that
+catalog, so new sections can be added to every locale in one step.
+"""
+import json
+
+from catalog_tools.catalogs import deep_merge, set_path
+from catalog_tools.paths import LOCALES, SOURCE_LOCALE
+
+
+def fill_missing(store, source, target):
+    """Copy keys present in `source` but not `target` into `target`; return them."""
+    model = store.model(source, target)
+    filled = model.fill(target, source)
+    added = [model.keys[i] for i in filled]
+    if filled:
+        data, like, col = store.tree(target), store.tree(source), model.columns[target]
+        for key, i in zip(added, filled):
+            set_path(data, key, col[i], like)
+        store.touch(target)
+    return added
+
+
+def apply_patch(store, patch):
+    for name, data in patch.items():
+        deep_merge(store.tree(name), data)
+        store.touch(name)
+    return list(patch)
+
+
+def configure(parser):
+    parser.add_argument("--from", dest="source", default=SOURCE_LOCALE, help="source locale (default: %(default)s)")
+    parser.add_argument("--into", nargs="+", help="target locales (default: all others)")
+    parser.add_argument("--patch", help="JSON file of {catalog: nested messages} to deep-merge")
+
+
+def run(args, store):
+    if args.patch:
+        with open(args.patch, "r", encoding="utf-8-sig") as f:
+            patched = apply_patch(store, json.load(f))
+        print(f"Patched {', '.join(patched)}.")
+        return 0
+
+    targets = args.into or [l for l in LOCALES if l != args.source]
+    for locale in targets:
+        for prefix in ("", "ambassador."):
+            source, target = f"{prefix}{args.source}", f"{prefix}{locale}"
+            if not (store.exists(source) and store.exists(target)):
+                continue
+            added = fill_missing(store, source, target)
+            print(f"{target}: {len(added)} keys added from {source}")
+            for key in added[:10]:
+                print(f"  {key}")
+            if len(added) > 10:
+                print(f"  ...and {len(added) - 10} more")
+    return 0
@@ -0,0 +1,267 @@
+"""Compact in-memory model of the flattened catalogs.
+
+Every key path is stored once, in a KeyTable shared by all catalogs; each
+catalog is a column, a list parallel to the key table holding the value or
+MISSING. en/hr/de (and ambassador.en/hr/de) use the same key paths, so a
+locale costs one pointer per key instead of a dict of freshly built key
+strings, and values equal to another column's at the same key (brand names,
+"API", untranslated copy) share that string. Cross-locale questions become
+index-aligned column comparisons.
+
+CatalogStore keeps one model; store.flat() and store.shipped() are views
+over it rather than separate dicts.
+
+    model = store.model("en", "hr")
+    for i in model.missing("hr", source="en"):
+        print(model.keys[i])
+"""
+from collections.abc import Mapping
+
+from catalog_tools.catalogs import to_js_string
+from catalog_tools.paths import SOURCE_LOCALE
+
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "MISSING"
+
+    def __bool__(self):
+        return False
+
+
+MISSING = _Missing()
+
+
+def iter_leaves(obj, prefix=""):
+    """Yield (key path, value) in the same order as catalogs.flatten(), without building a dict."""
+    stack = [(prefix, iter(obj.items() if isinstance(obj, dict) else enumerate(obj)))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            key = f"{prefix}.{k}" if prefix else str(k)
+            if isinstance(v, dict):
+                stack.append((key, iter(v.items())))
+                break
+            if isinstance(v, list):
+                stack.append((key, enumerate(v)))
+                break
+            yield key, to_js_string(v)
+        else:
+            stack.pop()
+
+
+class KeyTable:
+    """Interned key paths; a key's position is its index in every column."""
+
+    __slots__ = ("keys", "_index")
+
+    def __init__(self):
+        self.keys = []
+        self._index = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __getitem__(self, i):
+        return self.keys[i]
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def find(self, key):
+        return self._index.get(key)
+
+    def intern(self, key):
+        """Return the index of `key`, appending it if new."""
+        i = self._index.get(key)
+        if i is None:
+            i = self._index[key] = len(self.keys)
+            self.keys.append(key)
+        return i
+
+
+class CatalogModel:
+    __slots__ = ("keys", "columns")
+
+    def __init__(self):
+        self.keys = KeyTable()
+        self.columns = {}
+
+    @classmethod
+    def from_trees(cls, trees):
+        """Build from {name: parsed catalog}."""
+        model = cls()
+        for name, tree in trees.items():
+            model.add_column(name, iter_leaves(tree))
+        return model
+
+    def add_column(self, name, pairs):
+        """(Re)build column `name` from (key, value) pairs."""
+        others = list(self.columns.values())
+        col = self.columns[name] = [MISSING] * len(self.keys)
+        intern = self.keys.intern
+        for key, value in pairs:
+            i = intern(key)
+            if i == len(col):
+                col.append(value)
+            else:
+                col[i] = value
+        self._pad()
+        # Share equal strings with the other columns at the same key.
+        for other in others:
+            for i, (v, o) in enumerate(zip(col, other)):
+                if v is not o and v is not MISSING and v == o:
+                    col[i] = o
+        return col
+
+    def drop_column(self, name):
+        self.columns.pop(name, None)
+
+    def _pad(self):
+        n = len(self.keys)
+        for col in self.columns.values():
+            if len(col) < n:
+                col.extend([MISSING] * (n - len(col)))
+
+    def get(self, name, key, default=None):
+        i = self.keys.find(key)
+        if i is None:
+            return default
+        value = self.columns[name][i]
+        return default if value is MISSING else value
+
+    def set(self, name, key, value):
+        i = self.keys.intern(key)
+        self._pad()
+        self.columns[name][i] = value
+
+    # Bulk operations over whole columns. They return key indices, in key
+    # table order; use self.keys[i] for the path.
+
+    def present(self, name):
+        return [i for i, v in enumerate(self.columns[name]) if v is not MISSING]
+
+    def missing(self, name, source=SOURCE_LOCALE):
+        """Indices that have a value in `source` but not in `name`."""
+        return [
+            i
+            for i, (s, v) in enumerate(zip(self.columns[source], self.columns[name]))
+            if v is MISSING and s is not MISSING
+        ]
+
+    def extra(self, name, source=SOURCE_LOCALE):
+        """Indices that have a value in `name` but not in `source`."""
+        return self.missing(source, source=name)
+
+    def differ(self, a, b):
+        """Indices where both columns have a value and the values differ."""
+        return [
+            i
+            for i, (x, y) in enumerate(zip(self.columns[a], self.columns[b]))
+            if x is not y and x is not MISSING and y is not MISSING and x != y
+        ]
+
+    def select(self, name, predicate):
+        """Indices whose value in `name` satisfies `predicate`."""
+        return [i for i, v in enumerate(self.columns[name]) if v is not MISSING and predicate(v)]
+
+    def map(self, name, fn):
+        """Replace every value in `name` with fn(value); return the indices that changed."""
+        col = self.columns[name]
+        new = [v if v is MISSING else fn(v) for v in col]
+        changed = [i for i, (old, v) in enumerate(zip(col, new)) if old is not v and old != v]
+        self.columns[name] = new
+        return changed
+
+    def fill(self, target, source=SOURCE_LOCALE):
+        """Copy `source` values into keys `target` lacks; return the indices filled."""
+        filled = self.missing(target, source)
+        col, src = self.columns[target], self.columns[source]
+        for i in filled:
+            col[i] = src[i]
+        return filled
+
+
+class ColumnView(Mapping):
+    """Read-only flat-dict view of one column, keys optionally prefixed.
+
+    Iterates in key table order, which for the first catalog loaded is
+    document order; items() and values() are single-pass generators.
+    """
+
+    __slots__ = ("model", "name", "prefix")
+
+    def __init__(self, model, name, prefix=""):
+        self.model = model
+        self.name = name
+        self.prefix = prefix
+
+    def __getitem__(self, key):
+        if not key.startswith(self.prefix):
+            raise KeyError(key)
+        value = self.model.get(self.name, key[len(self.prefix):], MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return key.startswith(self.prefix) and self.model.get(self.name, key[len(self.prefix):], MISSING) is not MISSING
+
+    def __iter__(self):
+        return (k for k, _ in self.items())
+
+    def __len__(self):
+        return sum(1 for v in self.model.columns[self.name] if v is not MISSING)
+
+    def items(self):
+        prefix = self.prefix
+        for key, value in zip(self.model.keys.keys, self.model.columns[self.name]):
+            if value is not MISSING:
+                yield prefix + key, value
+
+    def values(self):
+        return (v for v in self.model.columns[self.name] if v is not MISSING)
+
+
+class OverlayView(Mapping):
+    """`base` with every key under `prefix` taken from `overlay` instead.
+
+    store.shipped() uses it for a locale plus ambassador.<locale> mounted
+    at "Ambassador.", as apps/web/i18n/config.ts assembles them.
+    """
+
+    __slots__ = ("base", "overlay", "prefix")
+
+    def __init__(self, base, overlay, prefix):
+        self.base = base
+        self.overlay = overlay
+        self.prefix = prefix
+
+    def _shadowed(self, key):
+        return key.startswith(self.prefix) or key == self.prefix[:-1]
+
+    def __getitem__(self, key):
+        return self.overlay[key] if self._shadowed(key) else self.base[key]
+
+    def __contains__(self, key):
+        return key in (self.overlay if self._shadowed(key) else self.base)
+
+    def __iter__(self):
+        return (k for k, _ in self.items())
+
+    def __len__(self):
+        return sum(1 for _ in self.items())
+
+    def items(self):
+        for key, value in self.base.items():
+            if not self._shadowed(key):
+                yield key, value
+        yield from self.overlay.items()
+
+    def values(self):
+        return (v for _, v in self.items())
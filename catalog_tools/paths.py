@@ -0,0 +1,41 @@
+import os
+
+LOCALES = ("en", "hr", "de")
+SOURCE_LOCALE = "en"
+MESSAGES_SUBDIR = os.path.join("apps", "web", "messages")
+# Catalogs the web app imports: i18n/config.ts and app/faq/page.tsx.
+SHIPPED_CATALOGS = tuple(
+    name for locale in LOCALES for name in (locale, f"ambassador.{locale}", f"faq.{locale}.manual")
+)
+
+
+def _is_repo_root(path):
+    return os.path.isfile(os.path.join(path, "pnpm-workspace.yaml")) and os.path.isdir(
+        os.path.join(path, MESSAGES_SUBDIR)
+    )
+
+
+def find_repo_root(start=None):
+    """Walk up from `start` (default: cwd, then this package) to the monorepo root."""
+    env = os.environ.get("THESARA_REPO_ROOT")
+    if env:
+        return os.path.abspath(env)
+    starts = [start] if start else [os.getcwd(), os.path.dirname(os.path.abspath(__file__))]
+    for path in starts:
+        path = os.path.abspath(path)
+        while True:
+            if _is_repo_root(path):
+                return path
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+    raise FileNotFoundError(f"no repo root with {MESSAGES_SUBDIR} above {', '.join(starts)}")
+
+
+def messages_dir(root=None):
+    return os.path.join(root or find_repo_root(), MESSAGES_SUBDIR)
+
+
+def compiled_dir(root=None):
+    return os.path.join(messages_dir(root), "compiled")
@@ -0,0 +1,28 @@
+"""Undo mojibake and non-UTF-8 encodings in catalogs (`repair` subcommand).
+
+Every string goes through encoding.repair_text(), and files that were saved
+as UTF-16, cp1252 or with a BOM are rewritten as plain UTF-8.
+"""
+from catalog_tools.encoding import repair_tree
+from catalog_tools.paths import SHIPPED_CATALOGS
+
+
+def configure(parser):
+    parser.add_argument("catalogs", nargs="*", help="catalog names, e.g. de ambassador.hr (default: all shipped)")
+
+
+def run(args, store):
+    total = 0
+    for name in args.catalogs or SHIPPED_CATALOGS:
+        if not args.catalogs and not store.exists(name):
+            continue
+        changed = repair_tree(store.tree(name))
+        reencode = store.encodings[name] != "utf-8"
+        if changed or reencode:
+            store.touch(name)
+        if changed or reencode or args.catalogs:
+            note = f" (was {store.encodings[name]})" if reencode else ""
+            print(f"{name}: {changed} strings repaired{note}")
+        total += changed
+    print(f"Repaired {total} strings.")
+    return 0
@@ -0,0 +1,39 @@
+"""Per-catalog key counts, coverage and corruption summary (`stats` subcommand)."""
+import os
+
+from catalog_tools.catalogs import CatalogError
+from catalog_tools.encoding import mojibake_score
+from catalog_tools.paths import LOCALES, SHIPPED_CATALOGS, SOURCE_LOCALE
+from catalog_tools.validate import parity, placeholders
+
+
+def configure(parser):
+    parser.add_argument("catalogs", nargs="*", help="catalog names (default: all shipped)")
+
+
+def run(args, store):
+    print(f"{'catalog':<22}{'keys':>7}{'KB':>8}{'params':>8}{'mojibake':>10}  encoding")
+    for name in args.catalogs or SHIPPED_CATALOGS:
+        if not store.exists(name):
+            continue
+        try:
+            flat = store.flat(name)
+        except CatalogError as e:
+            print(f"{name:<22}  {e}")
+            continue
+        size = os.path.getsize(store.path(name)) / 1024
+        with_params = sum(1 for v in flat.values() if placeholders(v))
+        broken = sum(1 for v in flat.values() if mojibake_score(v))
+        print(f"{name:<22}{len(flat):>7}{size:>8.1f}{with_params:>8}{broken:>10}  {store.encodings[name]}")
+
+    total = len(store.shipped(SOURCE_LOCALE))
+    print(f"\nCoverage of {SOURCE_LOCALE} ({total} keys, incl. Ambassador):")
+    for locale in LOCALES:
+        if locale == SOURCE_LOCALE:
+            continue
+        missing, extra, _ = parity(store, locale)
+        print(
+            f"  {locale}: {(total - len(missing)) / total:.1%} covered, "
+            f"{len(missing)} missing, {len(extra)} extra"
+        )
+    return 0
@@ -0,0 +1,146 @@
+"""Synthetic en/hr/de catalogs at large scales for i18n benchmarks (`synth` subcommand).
+
+The catalogs look like apps/web/messages: dozens to hundreds of namespaces,
+camelCase keys nested 1-5 levels deep, `{placeholder}` parameters, hr/de
+diacritics, long FAQ-style bodies and the occasional array. hr and de drop a
+small share of keys so fallback lookups are exercised too. Output is
+deterministic for a given seed.
+
+Usage:
+  python -m catalog_tools synth [--scales 10000,50000,200000] [--out .bench/i18n] [--seed 1]
+  node tools/bench-i18n.mjs .bench/i18n
+"""
+import json
+import os
+import random
+
+from catalog_tools.catalogs import flatten
+from catalog_tools.paths import LOCALES
+
+DEFAULT_SCALES = (10_000, 50_000, 200_000)
+
+WORDS = {
+    "en": "app apps game publish creator storage room play share price free review "
+          "upload build preview account profile settings payment ambassador language "
+          "search results favourite feedback report error retry loading thesara".split(),
+    "hr": "aplikacija igra objavi kreator spremište soba igraj podijeli cijena besplatno "
+          "recenzija učitaj izgradnja pregled račun profil postavke plaćanje ambasador "
+          "jezik pretraga rezultati omiljeno povratna prijava greška pokušaj učitavanje "
+          "čarobnjak ćelija žarulja šuma đak".split(),
+    "de": "App Spiel veröffentlichen Ersteller Speicher Raum spielen teilen Preis kostenlos "
+          "Bewertung hochladen Erstellung Vorschau Konto Profil Einstellungen Zahlung "
+          "Botschafter Sprache Suche Ergebnisse Favorit Rückmeldung Fehler erneut Laden "
+          "Größe Übersicht Schlüssel".split(),
+}
+PLACEHOLDERS = ("count", "name", "price", "date", "apps", "plays", "limit")
+KEY_PARTS = ("title", "subtitle", "label", "description", "placeholder", "error", "success",
+             "button", "tooltip", "body", "heading", "hint", "empty", "cta", "badge", "status")
+SECTION_PARTS = ("hero", "modal", "form", "list", "card", "steps", "sidebar", "filters",
+                 "actions", "errors", "toasts", "faq", "details", "header", "footer", "stats")
+
+
+def camel(rng, parts):
+    words = rng.sample(parts, rng.randint(1, 2))
+    return words[0] + "".join(w.capitalize() for w in words[1:])
+
+
+def sentence(rng, locale, n_words):
+    text = " ".join(rng.choice(WORDS[locale]) for _ in range(n_words))
+    return text[0].upper() + text[1:]
+
+
+def make_value(rng, locale, shape):
+    """Render one value; `shape` is drawn once per key so all locales agree on placeholders."""
+    kind, n_words, params = shape
+    if kind == "faq":
+        paras = [sentence(rng, locale, rng.randint(12, 30)) + "." for _ in range(n_words)]
+        text = " ".join(paras)
+    else:
+        text = sentence(rng, locale, n_words)
+    for p in params:
+        text += f" {{{p}}}"
+    return text
+
+
+def make_shape(rng, faq):
+    if faq:
+        return ("faq", rng.randint(3, 12), ())
+    params = tuple(rng.sample(PLACEHOLDERS, rng.randint(1, 2))) if rng.random() < 0.2 else ()
+    return ("text", rng.randint(1, 12), params)
+
+
+def make_tree(rng, n_keys, n_namespaces):
+    """Return a nested skeleton whose leaves are value shapes."""
+    tree = {}
+    namespaces = []
+    for i in range(n_namespaces):
+        name = camel(rng, SECTION_PARTS)
+        namespaces.append(f"Ns{i}{name[0].upper()}{name[1:]}")
+    for i in range(n_keys):
+        ns = namespaces[i % n_namespaces]
+        depth = rng.choices((0, 1, 2, 3, 4), weights=(25, 35, 25, 10, 5))[0]
+        node = tree.setdefault(ns, {})
+        for _ in range(depth):
+            section = f"{camel(rng, SECTION_PARTS)}{rng.randint(0, 30)}"
+            child = node.get(section)
+            if not isinstance(child, dict):
+                child = node[section] = {}
+            node = child
+        key = f"{camel(rng, KEY_PARTS)}{i}"
+        faq = ns.endswith(("Faq", "Details")) and rng.random() < 0.3
+        node[key] = make_shape(rng, faq)
+        if rng.random() < 0.003:
+            node[f"{key}List"] = [make_shape(rng, False) for _ in range(rng.randint(2, 6))]
+    return tree
+
+
+def render(rng, node, locale, missing):
+    if isinstance(node, dict):
+        out = {}
+        for k, v in node.items():
+            if isinstance(v, tuple) and locale != "en" and rng.random() < missing:
+                continue
+            out[k] = render(rng, v, locale, missing)
+        return out
+    if isinstance(node, list):
+        return [render(rng, v, locale, missing) for v in node]
+    return make_value(rng, locale, node)
+
+
+def generate(n_keys, seed=1, locales=LOCALES, missing=0.02):
+    rng = random.Random(seed)
+    tree = make_tree(rng, n_keys, max(8, min(400, n_keys // 250)))
+    return {locale: render(random.Random(f"{seed}:{locale}"), tree, locale, missing) for locale in locales}
+
+
+def write_scale(out_dir, n_keys, seed=1):
+    catalogs = generate(n_keys, seed)
+    scale_dir = os.path.join(out_dir, str(n_keys))
+    os.makedirs(scale_dir, exist_ok=True)
+    info = {"keys": n_keys, "seed": seed, "locales": {}}
+    for locale, data in catalogs.items():
+        path = os.path.join(scale_dir, f"{locale}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        info["locales"][locale] = {"flat_keys": len(flatten(data)), "bytes": os.path.getsize(path)}
+    return info
+
+
+def configure(parser):
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)),
+                        help="comma-separated key counts (default: %(default)s)")
+    parser.add_argument("--out", help="output directory (default: .bench/i18n in the repo root)")
+    parser.add_argument("--seed", type=int, default=1)
+
+
+def run(args, store):
+    out_dir = args.out or os.path.join(store.root, ".bench", "i18n")
+    manifest = {"seed": args.seed, "scales": []}
+    for n_keys in (int(s) for s in args.scales.split(",") if s):
+        info = write_scale(out_dir, n_keys, args.seed)
+        manifest["scales"].append(info)
+        sizes = ", ".join(f"{l} {v['flat_keys']} keys/{v['bytes'] // 1024} KB" for l, v in info["locales"].items())
+        print(f"{n_keys}: {sizes}")
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return 0
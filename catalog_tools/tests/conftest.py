@@ -0,0 +1,22 @@
+import json
+import os
+
+import pytest
+
+from catalog_tools.catalogs import CatalogStore
+from catalog_tools.paths import MESSAGES_SUBDIR
+
+
+@pytest.fixture
+def make_store(tmp_path):
+    """Return a function writing {name: data} as catalogs under tmp_path and opening a store."""
+
+    def make(catalogs):
+        messages = os.path.join(tmp_path, MESSAGES_SUBDIR)
+        os.makedirs(messages, exist_ok=True)
+        for name, data in catalogs.items():
+            with open(os.path.join(messages, f"{name}.json"), "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+        return CatalogStore(str(tmp_path))
+
+    return make
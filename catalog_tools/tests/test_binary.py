@@ -0,0 +1,95 @@
+"""Round trip of the binary catalog format.
+
+apps/api/test/fixtures/binary-catalog/ holds a compiled fixture that
+apps/api/test/binaryCatalog.test.ts reads with the TypeScript reader. After
+changing the format, regenerate it with `python -m catalog_tools.tests.test_binary`.
+"""
+import json
+import os
+
+import pytest
+
+from catalog_tools.binary import build, fnv1a32, open_catalogs
+from catalog_tools.catalogs import flatten
+
+FIXTURE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "apps", "api", "test", "fixtures", "binary-catalog",
+)
+FIXTURE_LOCALES = ("en", "hr")
+
+
+def fixture_messages():
+    out = {}
+    for locale in FIXTURE_LOCALES:
+        with open(os.path.join(FIXTURE, f"{locale}.json"), encoding="utf-8") as f:
+            out[locale] = flatten(json.load(f))
+    return out
+
+
+def write(out_dir, strings, indexes):
+    with open(os.path.join(out_dir, "strings.bin"), "wb") as f:
+        f.write(strings)
+    for locale, data in indexes.items():
+        with open(os.path.join(out_dir, f"{locale}.idx"), "wb") as f:
+            f.write(data)
+
+
+def test_fnv1a32_reference_values():
+    assert fnv1a32(b"") == 0x811C9DC5
+    assert fnv1a32(b"a") == 0xE40C292C
+    assert fnv1a32(b"foobar") == 0xBF9CF968
+
+
+def test_round_trip(tmp_path):
+    messages = fixture_messages()
+    write(tmp_path, *build(messages))
+    catalogs = open_catalogs(str(tmp_path), FIXTURE_LOCALES)
+    for locale, flat in messages.items():
+        catalog = catalogs[locale]
+        assert len(catalog) == len(flat)
+        for key, value in flat.items():
+            assert catalog[key] == value
+        assert dict(catalog.items()) == flat
+        assert catalog.get("Nav.nope") is None
+        assert "Nav" not in catalog
+    # Both keys of an FNV-1a collision resolve by comparing key bytes.
+    first, second = "Collide.k139599", "Collide.k322382"
+    assert fnv1a32(first.encode()) == fnv1a32(second.encode())
+    assert catalogs["en"][first] != catalogs["en"][second]
+    assert first not in catalogs["hr"] and second in catalogs["hr"]
+
+
+def test_index_is_sorted_by_hash_then_key_bytes(tmp_path):
+    write(tmp_path, *build(fixture_messages()))
+    catalog = open_catalogs(str(tmp_path), FIXTURE_LOCALES)["en"]
+    keys = [key.encode("utf-8") for key, _ in catalog.items()]
+    assert keys == sorted(keys, key=lambda raw: (fnv1a32(raw), raw))
+
+
+def test_strings_are_shared_across_locales():
+    strings, _ = build(fixture_messages())
+    assert strings.count("9,99 €".encode("utf-8")) == 1
+
+
+def test_index_from_another_build_is_rejected(tmp_path):
+    messages = fixture_messages()
+    strings, _ = build(messages)
+    _, other = build({"en": {**messages["en"], "Nav.new": "New"}})
+    write(tmp_path, strings, other)
+    with pytest.raises(ValueError, match="different strings.bin"):
+        open_catalogs(str(tmp_path), ("en",))
+
+
+def test_api_fixture_is_current():
+    strings, indexes = build(fixture_messages())
+    with open(os.path.join(FIXTURE, "strings.bin"), "rb") as f:
+        assert f.read() == strings
+    for locale, data in indexes.items():
+        with open(os.path.join(FIXTURE, f"{locale}.idx"), "rb") as f:
+            assert f.read() == data, f"{locale}.idx is stale"
+
+
+if __name__ == "__main__":
+    write(FIXTURE, *build(fixture_messages()))
+    print(f"Wrote {FIXTURE}")
@@ -0,0 +1,52 @@
+from catalog_tools.budget import analyze, check
+
+BUDGET = {
+    "metric": "gzip",
+    "default": 100,
+    "locale_total": 1000,
+    "namespaces": {"Admin": 500},
+    "pages": {"app/faq": 300},
+}
+
+
+def sizes(gzip, brotli=None):
+    return {"raw": gzip * 3, "gzip": gzip, "brotli": brotli}
+
+
+def report(namespaces, pages=None, total=900):
+    return {"locales": {"en": {"total": sizes(total), "namespaces": namespaces, "pages": pages or {}}}}
+
+
+def test_check_passes_within_budget():
+    assert check(report({"Admin": sizes(500), "Nav": sizes(100)}, {"app/faq": sizes(300)}), BUDGET) == []
+
+
+def test_check_uses_namespace_limits_then_default():
+    budget = {**BUDGET, "namespaces": {"Admin": 500, "Pro": 400}}
+    violations = check(report({"Admin": sizes(501), "Nav": sizes(101), "Pro": sizes(400)}), budget)
+    assert violations == ["en/Admin: 501 B gzip > budget 500 B", "en/Nav: 101 B gzip > budget 100 B"]
+
+
+def test_check_pages_and_locale_total():
+    violations = check(report({}, {"app/faq": sizes(301), "app/other": sizes(9999)}, total=1001), BUDGET)
+    assert violations == [
+        "en/app/faq page: 301 B gzip > budget 300 B",
+        "en: 1001 B gzip total > budget 1000 B",
+    ]
+
+
+def test_check_skips_unmeasured_sizes():
+    budget = {**BUDGET, "metric": "brotli"}
+    assert check(report({"Admin": sizes(9999)}, {"app/faq": sizes(9999)}, total=9999), budget) == []
+
+
+def test_pages_are_kept_out_of_the_shared_bundle(make_store):
+    store = make_store({
+        "en": {"Nav": {"about": "About"}},
+        "faq.en.manual": {"1": {"items": [{"a": "A long answer " * 20}]}},
+    })
+    data = analyze(store, locales=("en",), top=5)["locales"]["en"]
+    assert [item["key"] for item in data["top_keys"]] == ["Nav.about"]
+    assert [item["key"] for item in data["page_top_keys"]["app/faq"]] == ["1.items.0.a"]
+    assert list(data["namespaces"]) == ["Nav"]
+    assert list(data["pages"]) == ["app/faq"]
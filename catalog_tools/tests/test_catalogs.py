@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from catalog_tools.catalogs import CatalogError, flatten, set_path
+from catalog_tools.merge import fill_missing
+
+
+def test_set_path_creates_objects():
+    data = {}
+    set_path(data, "Nav.about", "About")
+    assert data == {"Nav": {"about": "About"}}
+
+
+def test_set_path_grows_lists():
+    data = {"steps": ["one"]}
+    set_path(data, "steps.1", "two")
+    set_path(data, "steps.2.title", "three")
+    assert data == {"steps": ["one", "two", {"title": "three"}]}
+
+
+def test_set_path_keeps_numeric_object_keys():
+    data = {}
+    set_path(data, "steps.1", "a")
+    assert data == {"steps": {"1": "a"}}
+
+
+def test_set_path_takes_container_types_from_like():
+    source = {
+        "Workshop": {"details": {"topics": ["a", "b", {"x": "c"}]}, "title": "T"},
+        "BetaHome": {"steps": {"1": {"title": "x"}, "2": {"title": "y"}}},
+    }
+    rebuilt = {}
+    for key, value in flatten(source).items():
+        set_path(rebuilt, key, value, source)
+    assert rebuilt == source
+
+
+def test_set_path_rejects_names_inside_lists():
+    with pytest.raises(CatalogError):
+        set_path({"steps": ["one"]}, "steps.title", "x")
+
+
+def test_fill_missing_extends_arrays(make_store):
+    store = make_store({
+        "en": {"Workshop": {"topics": ["a", "b", "c"], "title": "Workshop"}},
+        "hr": {"Workshop": {"topics": ["A"]}},
+    })
+    added = fill_missing(store, "en", "hr")
+    assert added == ["Workshop.topics.1", "Workshop.topics.2", "Workshop.title"]
+    store.save()
+    with open(store.path("hr"), encoding="utf-8") as f:
+        assert json.load(f) == {"Workshop": {"topics": ["A", "b", "c"], "title": "Workshop"}}
+
+
+def test_fill_missing_keeps_numbered_objects(make_store):
+    steps = {"1": {"title": "One"}, "2": {"title": "Two"}, "3": {"title": "Three"}}
+    store = make_store({"en": {"BetaHome": {"steps": steps}}, "hr": {"BetaHome": {}}})
+    fill_missing(store, "en", "hr")
+    store.save()
+    with open(store.path("hr"), encoding="utf-8") as f:
+        assert json.load(f) == {"BetaHome": {"steps": steps}}
@@ -0,0 +1,79 @@
+import pytest
+
+from catalog_tools.encoding import mojibake_score, repair_text, repair_tree
+
+CLEAN = [
+    # hr
+    "Čćžšđ ČĆŽŠĐ",
+    "Pošalji prijavu — veličina publike (cca)",
+    "„Thesara” je tržnica za igre",
+    # de
+    "Über Größe: „Grüße“ – 5 €",
+    "Bewerbung zum Ambassador-Programm bestätigt…",
+    # fr and friends, outside the characters catalog text usually holds
+    "Ça va",
+    "Côte d’Ivoire",
+    "Où est la bibliothèque ? « Noël » à 9 h",
+    "naïve façade, cœur, Œuvre, Ÿ",
+    "±10 %",
+    "1½ h",
+    "Ångström, Øre, Þór",
+    "🙂 👨‍💻",
+]
+
+# Keys of the replacement table in the old fix_i18n.py script, with the
+# values it meant.
+REPAIRED = [
+    ("ÃƒÂ¼", "ü"),
+    ("ÃƒÂ¶", "ö"),
+    ("ÃƒÂ¤", "ä"),
+    ("ÃƒÅ¸", "ß"),
+    ("ÃƒÂ©", "é"),
+    ("Ã¼", "ü"),
+    ("Ã¶", "ö"),
+    ("Ã¤", "ä"),
+    ("ÃŸ", "ß"),
+    ("Ã¢â‚¬â€\x9d", "—"),
+    ("Ã¢â‚¬Å“", "“"),
+    ("Ã¢â‚¬Â¦", "…"),
+    ("Ã¢â€“â€ž", "Ü"),
+    ("Ã¢â€\x9dÅ“Ã¢â€¢Â¢", "ö"),
+    ("ÃƒÂ·", "ö"),
+    ("ÃŽÂ£", "ä"),
+    ("â€¦", "…"),
+    ("â‚¬", "€"),
+    ("ðŸ™‚", "🙂"),
+    ("â–„", "Ü"),
+]
+
+
+@pytest.mark.parametrize("text", CLEAN)
+def test_clean_text_is_left_alone(text):
+    assert repair_text(text) == text
+
+
+def test_no_single_latin_character_is_rewritten():
+    for code in range(0xA0, 0x250):
+        text = f"a{chr(code)}b"
+        assert repair_text(text) == text, hex(code)
+
+
+@pytest.mark.parametrize("broken, fixed", REPAIRED)
+def test_known_mojibake_is_repaired(broken, fixed):
+    assert repair_text(f"ver{broken}ffentlichen") == f"ver{fixed}ffentlichen"
+
+
+@pytest.mark.parametrize(
+    "broken",
+    ["Ã¢â€Å\"Ã‚Â£ber", "Ã¢â€ Å“Ã‚Â£", "Ã¢Â Â¿", "Ã¢â‚¬Â¬"],
+)
+def test_lossy_runs_never_get_worse(broken):
+    fixed = repair_text(broken)
+    assert mojibake_score(fixed) <= mojibake_score(broken)
+    assert not any(0x80 <= ord(ch) <= 0x9F or ord(ch) < 0x20 for ch in fixed)
+
+
+def test_repair_tree_counts_changed_strings():
+    data = {"a": "GrÃ¶ÃŸe", "b": ["Ça va", "â€¦"], "c": 3}
+    assert repair_tree(data) == 2
+    assert data == {"a": "Größe", "b": ["Ça va", "…"], "c": 3}
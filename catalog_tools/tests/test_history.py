@@ -0,0 +1,110 @@
+import json
+import os
+import subprocess
+
+import pytest
+
+from catalog_tools.catalogs import CatalogStore
+from catalog_tools.history import broken_keys, empty_index, iter_changes, last_good, restore, update
+from catalog_tools.paths import MESSAGES_SUBDIR
+
+
+class Repo:
+    def __init__(self, root):
+        self.root = str(root)
+        self.messages = os.path.join(self.root, MESSAGES_SUBDIR)
+        os.makedirs(self.messages)
+        open(os.path.join(self.root, "pnpm-workspace.yaml"), "w").close()
+        self.git("init", "-q", "-b", "main")
+
+    def git(self, *args):
+        return subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            cwd=self.root, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+
+    def commit(self, subject, catalogs=None, delete=()):
+        for name, data in (catalogs or {}).items():
+            with open(os.path.join(self.messages, f"{name}.json"), "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        for name in delete:
+            os.remove(os.path.join(self.messages, f"{name}.json"))
+        self.git("add", "-A")
+        self.git("commit", "-q", "--allow-empty", "-m", subject)
+        return self.git("rev-parse", "HEAD")
+
+    def blob(self, rev, name):
+        return self.git("rev-parse", f"{rev}:apps/web/messages/{name}.json")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return Repo(tmp_path)
+
+
+def indexed(repo):
+    index = empty_index()
+    update(index, repo.root)
+    return index
+
+
+def test_iter_changes_reads_raw_lines(repo):
+    repo.commit("add", {"en": {"a": "A"}, "hr": {"a": "A"}})
+    repo.commit("unrelated")
+    repo.commit("edit hr", {"hr": {"a": "B"}})
+    repo.commit("drop hr", delete=["hr"])
+    changes = [(subject, files) for _, _, subject, files in iter_changes(repo.root)]
+    en, hr = "apps/web/messages/en.json", "apps/web/messages/hr.json"
+    assert changes == [
+        ("add", [(en, [None], repo.blob("HEAD~3", "en")), (hr, [None], repo.blob("HEAD~3", "hr"))]),
+        ("edit hr", [(hr, [repo.blob("HEAD~3", "hr")], repo.blob("HEAD~1", "hr"))]),
+        ("drop hr", [(hr, [repo.blob("HEAD~1", "hr")], None)]),
+    ]
+    since = repo.git("rev-parse", "HEAD~1")
+    assert [subject for _, _, subject, _ in iter_changes(repo.root, since)] == ["drop hr"]
+
+
+def test_update_continues_from_the_stored_head(repo):
+    repo.commit("one", {"en": {"a": "A", "b": "B"}})
+    repo.commit("two", {"en": {"a": "A2", "b": "B"}})
+    index = indexed(repo)
+    repo.commit("three", {"en": {"a": "A2", "c": "C"}})
+    assert update(index, repo.root) == 1
+    assert update(index, repo.root) == 0
+    assert index == indexed(repo)
+    keys = index["files"]["en"]["keys"]
+    assert [event[0] for event in keys["a"]] == [0, 1]
+    assert keys["b"][-1][1] is None
+    assert sorted(index["files"]["en"]["current"]) == ["a", "c"]
+
+
+def test_broken_keys_name_the_commit_on_a_merged_branch(repo):
+    clean = {k: k.upper() for k in "abcde"}
+    clean["a"] = "Café"
+    repo.commit("start", {"en": clean})
+    repo.git("checkout", "-q", "-b", "side")
+    broke = repo.commit("break a", {"en": {**clean, "a": "CafÃ©"}})
+    repo.git("checkout", "-q", "main")
+    repo.commit("edit e", {"en": {**clean, "e": "E2"}})
+    repo.git("merge", "-q", "--no-ff", "-m", "merge side", "side")
+    index = indexed(repo)
+    broken = broken_keys(index, "en")
+    assert list(broken) == ["a"]
+    assert broken["a"]["commit"] == broke
+    assert last_good(index, "en", "a")["value"] == "Café"
+    # e changed on main only, so the merge introduced no value of its own.
+    merge_idx = len(index["commits"]) - 1
+    assert all(e[0] != merge_idx for events in index["files"]["en"]["keys"].values() for e in events)
+
+
+def test_restore_writes_only_changed_values(repo):
+    repo.commit("start", {"en": {"a": "Café", "b": "x"}})
+    repo.commit("edit", {"en": {"a": "CafÃ©", "b": "y"}})
+    index = indexed(repo)
+    store = CatalogStore(repo.root)
+    assert list(restore(index, store, "en", ["b"])) == []
+    assert not store.dirty
+    assert list(restore(index, store, "en", ["a", "b"])) == ["a"]
+    store.save()
+    with open(store.path("en"), encoding="utf-8") as f:
+        assert json.load(f) == {"a": "Café", "b": "y"}
@@ -0,0 +1,105 @@
+from catalog_tools.catalogs import flatten
+from catalog_tools.model import MISSING, CatalogModel, iter_leaves
+from catalog_tools.validate import validate
+
+TREE = {
+    "Nav": {"about": "About", "count": 3, "beta": True, "none": None},
+    "Workshop": {"topics": ["a", {"x": "b"}, []], "empty": {}},
+    "title": "Thesara",
+    "z": {"deep": {"er": {"est": "!"}}},
+    "a": "after",
+}
+
+
+def test_iter_leaves_matches_flatten():
+    assert list(iter_leaves(TREE)) == list(flatten(TREE).items())
+
+
+def make_model():
+    return CatalogModel.from_trees({
+        "en": {"a": "A {n}", "b": "B", "c": "Thesara"},
+        "hr": {"a": "A {x}", "c": "Thesara", "d": "D"},
+    })
+
+
+def keys(model, indices):
+    return [model.keys[i] for i in indices]
+
+
+def test_columns_share_the_key_table():
+    model = make_model()
+    assert list(model.keys) == ["a", "b", "c", "d"]
+    assert model.columns["en"] == ["A {n}", "B", "Thesara", MISSING]
+    assert model.columns["hr"] == ["A {x}", MISSING, "Thesara", "D"]
+    assert model.columns["hr"][2] is model.columns["en"][2]
+
+
+def test_missing_extra_differ():
+    model = make_model()
+    assert keys(model, model.missing("hr", "en")) == ["b"]
+    assert keys(model, model.extra("hr", "en")) == ["d"]
+    assert keys(model, model.differ("en", "hr")) == ["a"]
+
+
+def test_fill_copies_source_values():
+    model = make_model()
+    assert keys(model, model.fill("hr", "en")) == ["b"]
+    assert model.get("hr", "b") == "B"
+    assert model.missing("hr", "en") == []
+
+
+def test_get_set_select_map():
+    model = make_model()
+    assert model.get("en", "d") is None
+    assert model.get("en", "nope", "x") == "x"
+    model.set("en", "e", "E")
+    assert model.columns["hr"][model.keys.find("e")] is MISSING
+    assert keys(model, model.select("en", lambda v: "{" in v)) == ["a"]
+    assert keys(model, model.map("en", str.upper)) == ["a", "c"]
+    assert model.get("en", "a") == "A {N}"
+
+
+def test_store_views_match_flatten(make_store):
+    store = make_store({
+        "en": TREE,
+        "hr": {"Nav": {"about": "O nama"}, "extra": ["x"]},
+        "ambassador.en": {"title": "Ambassador"},
+    })
+    assert dict(store.flat("en")) == flatten(TREE)
+    assert dict(store.flat("hr").items()) == {"Nav.about": "O nama", "extra.0": "x"}
+    shipped = store.shipped("en")
+    assert dict(shipped) == {**flatten(TREE), "Ambassador.title": "Ambassador"}
+    assert shipped["Ambassador.title"] == "Ambassador"
+    assert "Ambassador.nope" not in shipped
+    assert len(shipped) == len(flatten(TREE)) + 1
+
+
+def test_touch_rebuilds_the_column(make_store):
+    store = make_store({"en": {"a": "A"}})
+    store.flat("en")
+    store.tree("en")["b"] = "B"
+    store.touch("en")
+    assert dict(store.flat("en")) == {"a": "A", "b": "B"}
+
+
+def test_one_broken_locale_does_not_hide_the_others(make_store):
+    store = make_store({"en": {"a": "{n} apps"}, "de": {"a": "{x} Apps"}})
+    with open(store.path("hr"), "w", encoding="utf-8") as f:
+        f.write("{ nope")
+    errors, _ = validate(store)
+    assert any(e.startswith(store.path("hr")) for e in errors)
+    assert any(e.startswith("de: a: placeholders") for e in errors)
+
+
+def test_each_catalog_is_parsed_once(make_store, monkeypatch):
+    store = make_store({"en": {"a": "A"}, "hr": {"a": "A", "b": "B"}, "ambassador.en": {"t": "T"}})
+    parsed = []
+    parse = store._parse
+    monkeypatch.setattr(store, "_parse", lambda name: parsed.append(name) or parse(name))
+    dict(store.shipped("en"))
+    store.model("en", "hr")
+    validate(store)
+    store.tree("hr")["c"] = "C"
+    store.touch("hr")
+    assert dict(store.flat("hr")) == {"a": "A", "b": "B", "c": "C"}
+    assert sorted(parsed) == ["ambassador.en", "en", "hr"]
@@ -0,0 +1,24 @@
+from catalog_tools.catalogs import flatten
+from catalog_tools.synthetic import PLACEHOLDERS, generate
+from catalog_tools.validate import placeholders
+
+
+def test_same_seed_same_catalogs():
+    assert generate(2000, seed=3) == generate(2000, seed=3)
+    assert generate(2000, seed=3) != generate(2000, seed=4)
+
+
+def test_placeholders_match_en_key_by_key():
+    # tools/bench-i18n.mjs formats hr values with a params object that
+    # covers PLACEHOLDERS; every locale must use the same ones as en.
+    catalogs = {locale: flatten(data) for locale, data in generate(2000, seed=3).items()}
+    en = catalogs.pop("en")
+    used = set()
+    for value in en.values():
+        used |= placeholders(value)
+    assert used == set(PLACEHOLDERS)
+    for locale, flat in catalogs.items():
+        assert flat.keys() <= en.keys()
+        assert len(flat) > 0.9 * len(en)
+        for key, value in flat.items():
+            assert placeholders(value) == placeholders(en[key]), f"{locale}: {key}"
@@ -0,0 +1,94 @@
+"""Check catalogs against each other and for corruption (`validate` subcommand).
+
+Errors (exit 1): unparseable or non-UTF-8 files, mojibake, and translations
+whose {placeholders} differ from en. Keys missing from or extra to en are
+warnings unless --strict is given; duplicate keys are always warnings.
+"""
+import re
+
+from catalog_tools.catalogs import CatalogError
+from catalog_tools.encoding import mojibake_score
+from catalog_tools.paths import LOCALES, SHIPPED_CATALOGS, SOURCE_LOCALE
+
+PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+def placeholders(value):
+    return set(PLACEHOLDER.findall(value))
+
+
+def parity(store, locale):
+    """Compare the shipped messages of `locale` with the source locale.
+
+    Returns sorted (missing keys, extra keys, [(key, wanted placeholders,
+    found placeholders)]). Each catalog family (en/hr/de, ambassador.*) is
+    compared column against column in the store's model.
+    """
+    missing, extra, mismatched = [], [], []
+    for prefix, source, target in (
+        ("", SOURCE_LOCALE, locale),
+        ("Ambassador.", f"ambassador.{SOURCE_LOCALE}", f"ambassador.{locale}"),
+    ):
+        if not (store.exists(source) or store.exists(target)):
+            continue
+        model = store.model(source, target)
+        keys, src, col = model.keys, model.columns[source], model.columns[target]
+        missing += [prefix + keys[i] for i in model.missing(target, source)]
+        extra += [prefix + keys[i] for i in model.extra(target, source)]
+        for i in model.differ(source, target):
+            want, got = placeholders(src[i]), placeholders(col[i])
+            if want != got:
+                mismatched.append((prefix + keys[i], want, got))
+    return sorted(missing), sorted(extra), sorted(mismatched, key=lambda m: m[0])
+
+
+def validate(store, strict=False):
+    """Return (errors, warnings) as lists of strings."""
+    errors, warnings = [], []
+    for name in SHIPPED_CATALOGS:
+        if not store.exists(name):
+            continue
+        try:
+            flat = store.flat(name)
+        except CatalogError as e:
+            errors.append(str(e))
+            continue
+        # Dirty catalogs are rewritten as UTF-8 on save.
+        if name not in store.dirty and store.encodings.get(name, "utf-8") != "utf-8":
+            errors.append(f"{name}: saved as {store.encodings[name]}, expected UTF-8 without BOM")
+        for key in store.duplicates.get(name, ()):
+            warnings.append(f"{name}: duplicate key {key!r}, earlier value ignored")
+        for key, value in flat.items():
+            if mojibake_score(value):
+                errors.append(f"{name}: {key}: mojibake {value[:60]!r}")
+
+    for locale in LOCALES:
+        if locale == SOURCE_LOCALE:
+            continue
+        try:
+            missing, extra, mismatched = parity(store, locale)
+        except CatalogError:
+            continue
+        for key in missing:
+            (errors if strict else warnings).append(f"{locale}: missing {key}")
+        for key in extra:
+            (errors if strict else warnings).append(f"{locale}: not in {SOURCE_LOCALE}: {key}")
+        for key, want, got in mismatched:
+            errors.append(f"{locale}: {key}: placeholders {sorted(got)} != {SOURCE_LOCALE} {sorted(want)}")
+    return errors, warnings
+
+
+def configure(parser):
+    parser.add_argument("--strict", action="store_true", help="treat missing/extra keys as errors")
+    parser.add_argument("-v", "--verbose", action="store_true", help="list every warning, not just counts")
+
+
+def run(args, store):
+    errors, warnings = validate(store, args.strict)
+    for e in errors:
+        print(f"ERROR {e}")
+    if args.verbose:
+        for w in warnings:
+            print(f"WARN  {w}")
+    print(f"{len(errors)} errors, {len(warnings)} warnings.")
+    return 1 if errors else 0
@@ -0,0 +1,217 @@
+#!/usr/bin/env node
+// Headless scaling benchmark for the web i18n runtime on synthetic catalogs.
+//
+//   python -m catalog_tools synth               # writes .bench/i18n/<scale>/{en,hr,de}.json
+//   node tools/bench-i18n.mjs [dir] [--out file.jsonl]
+//
+// For every scale a fresh `node --expose-gc` child measures module init
+// (JSON.parse + flatten(), as apps/web/i18n/config.ts does for its JSON
+// imports), retained heap, `messages[fullKey] ?? key` lookups and the
+// throughput of interpolate() from apps/web/lib/i18n-provider.tsx. One JSON line per run is appended to the output file
+// (default <dir>/history.jsonl) so results can be tracked over time.
+
+import fs from 'node:fs';
+import path from 'node:path';
+import { spawnSync, execSync } from 'node:child_process';
+import { fileURLToPath } from 'node:url';
+import { performance } from 'node:perf_hooks';
+
+const __filename = fileURLToPath(import.meta.url);
+const repoRoot = path.resolve(path.dirname(__filename), '..');
+const LOCALES = ['en', 'hr', 'de'];
+
+// The functions under test are read from the web app's own sources, so the
+// benchmark always measures the code that ships: the function text is cut
+// out of the .ts/.tsx file, its type annotations are stripped and the result
+// is evaluated. Anything that does not survive that (or the sanity check
+// below) fails the run instead of benchmarking a stale copy.
+const SOURCES = {
+  flatten: 'apps/web/i18n/config.ts',
+  interpolate: 'apps/web/lib/i18n-provider.tsx',
+};
+
+// Splits at `sep` outside (), <>, [] and {}.
+function splitTop(text, sep) {
+  const parts = [];
+  let depth = 0;
+  let start = 0;
+  for (let i = 0; i < text.length; i++) {
+    const c = text[i];
+    if ('(<[{'.includes(c)) depth++;
+    else if (')>]}'.includes(c) && text[i - 1] !== '=') depth--;
+    else if (c === sep && depth === 0) {
+      parts.push(text.slice(start, i));
+      start = i + 1;
+    }
+  }
+  parts.push(text.slice(start));
+  return parts;
+}
+
+// Enough TypeScript removal for small helpers: parameter and return types,
+// typed const/let declarations and `as` casts. Anything else is left alone
+// and makes new Function() throw.
+function stripTypes(code) {
+  const open = code.indexOf('(');
+  let depth = 0;
+  let close = open;
+  for (; close < code.length; close++) {
+    if (code[close] === '(') depth++;
+    else if (code[close] === ')' && --depth === 0) break;
+  }
+  const params = splitTop(code.slice(open + 1, close), ',')
+    .map((param) => {
+      const [decl, ...init] = splitTop(param, '=');
+      const name = splitTop(decl, ':')[0].replace('?', '').trim();
+      return init.length ? `${name} = ${init.join('=').trim()}` : name;
+    })
+    .join(', ');
+  const body = code.slice(code.indexOf('{', close));
+  return `${code.slice(0, open)}(${params}) ${body}`
+    .replace(/\b(const|let)\s+(\w+)\s*:[^=]+=/g, '$1 $2 =')
+    .replace(/\s+as\s+[A-Za-z_][\w.]*(<[^>]*>)?(\[\])?/g, '');
+}
+
+function loadFunction(name) {
+  const file = SOURCES[name];
+  const src = fs.readFileSync(path.join(repoRoot, file), 'utf8');
+  const start = src.search(new RegExp(`^(export )?function ${name}\\(`, 'm'));
+  const end = src.indexOf('\n}\n', start);
+  if (start === -1 || end === -1) throw new Error(`${file}: function ${name}() not found`);
+  const code = stripTypes(src.slice(start, end + 2).replace(/^export /, ''));
+  try {
+    return new Function(`${code}\nreturn ${name};`)();
+  } catch (err) {
+    throw new Error(`${file}: could not load ${name}() without its types (${err.message}):\n${code}`);
+  }
+}
+
+const flatten = loadFunction('flatten');
+const interpolate = loadFunction('interpolate');
+{
+  const flat = JSON.stringify(flatten({ a: { b: 1, c: [true, { d: null }] }, e: 'x' }));
+  const text = interpolate('{count} apps by {name}', { count: 3, name: 'Ana' });
+  if (flat !== '{"a.b":"1","a.c.0":"true","a.c.1.d":"null","e":"x"}' || text !== '3 apps by Ana') {
+    throw new Error(`flatten()/interpolate() from ${Object.values(SOURCES).join(', ')} no longer behave as expected`);
+  }
+}
+
+function opsPerSec(fn, iterations) {
+  fn(Math.min(iterations, 10_000)); // warm up the JIT
+  const start = performance.now();
+  fn(iterations);
+  return Math.round(iterations / ((performance.now() - start) / 1000));
+}
+
+function child(scaleDir) {
+  global.gc();
+  const heapBefore = process.memoryUsage().heapUsed;
+  const t0 = performance.now();
+  const raw = Object.fromEntries(
+    LOCALES.map((l) => [l, JSON.parse(fs.readFileSync(path.join(scaleDir, `${l}.json`), 'utf8'))]),
+  );
+  const t1 = performance.now();
+  const messages = Object.fromEntries(LOCALES.map((l) => [l, flatten(raw[l])]));
+  const t2 = performance.now();
+  global.gc();
+  const heapUsed = process.memoryUsage().heapUsed - heapBefore;
+
+  // useT(ns)(key) splits into namespace + key; mix in ~10% misses, which
+  // fall back to the key itself.
+  const en = messages.en;
+  const keys = Object.keys(en);
+  const probes = [];
+  for (let i = 0; i < 50_000; i++) {
+    const full = keys[(i * 7919) % keys.length];
+    const dot = full.indexOf('.');
+    const ns = dot === -1 ? undefined : full.slice(0, dot);
+    const key = dot === -1 ? full : full.slice(dot + 1);
+    probes.push([ns, i % 10 === 0 ? `${key}Missing` : key]);
+  }
+  const locale = messages.hr;
+  let sink = 0;
+  const lookupOps = opsPerSec((n) => {
+    for (let i = 0; i < n; i++) {
+      const [ns, key] = probes[i % probes.length];
+      const fullKey = ns ? `${ns}.${key}` : key;
+      sink += (locale[fullKey] ?? key).length;
+    }
+  }, 2_000_000);
+
+  const templates = keys.map((k) => locale[k]).filter((v) => v && v.includes('{')).slice(0, 5_000);
+  const params = { count: 42, name: 'Ana', price: '9,99 €', date: '18.10.', apps: 1200, plays: 98000, limit: 5 };
+  const formatOps = templates.length
+    ? opsPerSec((n) => {
+        for (let i = 0; i < n; i++) sink += interpolate(templates[i % templates.length], params).length;
+      }, 500_000)
+    : null;
+
+  process.stdout.write(
+    JSON.stringify({
+      flatKeys: Object.fromEntries(LOCALES.map((l) => [l, Object.keys(messages[l]).length])),
+      bytes: Object.fromEntries(LOCALES.map((l) => [l, fs.statSync(path.join(scaleDir, `${l}.json`)).size])),
+      initMs: +(t2 - t0).toFixed(2),
+      parseMs: +(t1 - t0).toFixed(2),
+      flattenMs: +(t2 - t1).toFixed(2),
+      heapBytes: heapUsed,
+      rssBytes: process.memoryUsage().rss,
+      lookupOpsPerSec: lookupOps,
+      formatOpsPerSec: formatOps,
+      sink: sink > 0,
+    }),
+  );
+}
+
+function main(argv) {
+  let outFile = null;
+  const positional = [];
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--out') outFile = argv[++i];
+    else positional.push(argv[i]);
+  }
+  const dir = path.resolve(positional[0] ?? path.join(repoRoot, '.bench', 'i18n'));
+  const scales = fs
+    .readdirSync(dir, { withFileTypes: true })
+    .filter((d) => d.isDirectory() && /^\d+$/.test(d.name))
+    .map((d) => Number(d.name))
+    .sort((a, b) => a - b);
+  if (!scales.length) {
+    console.error(`No <scale>/ catalogs in ${dir}; run \`python -m catalog_tools synth\` first.`);
+    process.exit(2);
+  }
+
+  const results = [];
+  for (const scale of scales) {
+    const res = spawnSync(process.execPath, ['--expose-gc', __filename, '--child', path.join(dir, String(scale))], {
+      encoding: 'utf8',
+      maxBuffer: 16 * 1024 * 1024,
+    });
+    if (res.status !== 0) {
+      console.error(`[bench-i18n] scale ${scale} failed:\n${res.stderr}`);
+      process.exit(1);
+    }
+    const { sink, ...r } = JSON.parse(res.stdout);
+    results.push({ scale, ...r });
+    const mb = (n) => (n / 1024 / 1024).toFixed(1);
+    console.log(
+      `${String(scale).padStart(7)} keys  init ${r.initMs.toFixed(1)} ms (parse ${r.parseMs.toFixed(1)}, flatten ${r.flattenMs.toFixed(1)})` +
+        `  heap ${mb(r.heapBytes)} MB  lookup ${(r.lookupOpsPerSec / 1e6).toFixed(2)} M/s` +
+        `  format ${r.formatOpsPerSec ? (r.formatOpsPerSec / 1e6).toFixed(2) + ' M/s' : '-'}`,
+    );
+  }
+
+  let commit = null;
+  try {
+    commit = execSync('git rev-parse --short HEAD', { cwd: repoRoot, encoding: 'utf8' }).trim();
+  } catch {}
+  const entry = { time: new Date().toISOString(), node: process.version, commit, results };
+  const target = outFile ? path.resolve(outFile) : path.join(dir, 'history.jsonl');
+  fs.appendFileSync(target, JSON.stringify(entry) + '\n');
+  console.log(`Results appended to ${target}`);
+}
+
+if (process.argv[2] === '--child') {
+  child(process.argv[3]);
+} else {
+  main(process.argv.slice(2));
+}